@@ -0,0 +1,93 @@
+"""Инкрементальная агрегация результатов тренировок по спортсменам."""
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from homework import InfoMessage
+
+METRICS: tuple[str, ...] = ('distance', 'speed', 'calories')
+
+
+@dataclass(slots=True)
+class WindowTotals:
+    """Итоги тренировок спортсмена за окно времени."""
+    count: int
+    distance: float
+    calories: float
+    mean_speed: float
+    max_distance: float
+    max_speed: float
+    max_calories: float
+
+
+class RollingWindow:
+    """Скользящее окно с суммами и максимумами за O(1) на обновление."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self.items: deque[tuple[float, InfoMessage]] = deque()
+        self.sums = dict.fromkeys(METRICS, 0.0)
+        self.maxima: dict[str, deque[tuple[float, float]]] = {
+            metric: deque() for metric in METRICS}
+
+    def add(self, timestamp: float, info: InfoMessage) -> None:
+        """Добавить результат; метки времени не должны убывать."""
+        if self.items and timestamp < self.items[-1][0]:
+            raise ValueError('Метки времени должны идти по возрастанию')
+        self.items.append((timestamp, info))
+        for metric, candidates in self.maxima.items():
+            value = getattr(info, metric)
+            self.sums[metric] += value
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+            candidates.append((timestamp, value))
+        self.evict(timestamp)
+
+    def evict(self, now: float) -> None:
+        """Убрать результаты, вышедшие за границу окна."""
+        border = now - self.window
+        while self.items and self.items[0][0] <= border:
+            _, info = self.items.popleft()
+            for metric in METRICS:
+                self.sums[metric] -= getattr(info, metric)
+        for candidates in self.maxima.values():
+            while candidates and candidates[0][0] <= border:
+                candidates.popleft()
+
+    def totals(self) -> WindowTotals:
+        """Вернуть текущие итоги окна без пересчёта."""
+        count = len(self.items)
+        if not count:
+            return WindowTotals(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        return WindowTotals(count,
+                            self.sums['distance'],
+                            self.sums['calories'],
+                            self.sums['speed'] / count,
+                            self.maxima['distance'][0][1],
+                            self.maxima['speed'][0][1],
+                            self.maxima['calories'][0][1])
+
+
+class RollingAggregator:
+    """Агрегатор результатов по спортсменам и видам тренировок."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self.windows: dict[tuple[str, str], RollingWindow] = {}
+
+    def add(self, athlete: str, info: InfoMessage, timestamp: float) -> None:
+        """Учесть результат тренировки спортсмена."""
+        key = (athlete, info.training_type)
+        if key not in self.windows:
+            self.windows[key] = RollingWindow(self.window)
+        self.windows[key].add(timestamp, info)
+
+    def totals(self, athlete: str, training_type: str,
+               now: Optional[float] = None) -> WindowTotals:
+        """Вернуть итоги спортсмена по виду тренировки на момент now."""
+        rolling = self.windows.get((athlete, training_type))
+        if rolling is None:
+            return RollingWindow(self.window).totals()
+        if now is not None:
+            rolling.evict(now)
+        return rolling.totals()
@@ -0,0 +1,98 @@
+"""Колоночное хранение тренировок одного вида вместо списков объектов."""
+from array import array
+from itertools import compress
+from typing import Iterable, Iterator, Union, overload
+
+from homework import (WORKOUT_REGISTRY, InfoMessage, Training, compute_batch,
+                      find_data_error)
+
+
+class TrainingBatch:
+    """Набор тренировок одного вида, хранящийся колонками array('d')."""
+
+    def __init__(self, workout_type: str) -> None:
+        if workout_type not in WORKOUT_REGISTRY:
+            raise NameError('Ошибка полученных данных')
+        self.workout_type = workout_type
+        self.spec = WORKOUT_REGISTRY[workout_type]
+        self.columns: dict[str, array] = {
+            name: array('d') for name in self.spec.fields}
+
+    def append(self, data: list[float]) -> None:
+        """Добавить пакет данных от датчиков.
+
+        Пакет проверяется целиком до записи, чтобы колонки не разошлись.
+        """
+        reason = find_data_error(self.workout_type, data)
+        if reason:
+            raise NameError(f'Ошибка полученных данных: {reason}')
+        for column, value in zip(self.columns.values(), data):
+            column.append(value)
+
+    def extend(self, packages: Iterable[list[float]]) -> None:
+        """Добавить несколько пакетов данных."""
+        for data in packages:
+            self.append(data)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.spec.fields[0]])
+
+    @overload
+    def __getitem__(self, index: int) -> Training:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'TrainingBatch':
+        ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._from_columns(
+                {name: column[index]
+                 for name, column in self.columns.items()})
+        return self.spec.training_class(
+            *(column[index] for column in self.columns.values()))
+
+    def __iter__(self) -> Iterator[Training]:
+        """Лениво построить объекты тренировок."""
+        for values in zip(*self.columns.values()):
+            yield self.spec.training_class(*values)
+
+    def filter(self, mask: Iterable[bool]) -> 'TrainingBatch':
+        """Оставить строки, для которых маска истинна."""
+        mask = list(mask)
+        if len(mask) != len(self):
+            raise ValueError(f'Длина маски {len(mask)} не равна '
+                             f'числу строк {len(self)}')
+        return self._from_columns(
+            {name: array('d', compress(column, mask))
+             for name, column in self.columns.items()})
+
+    def show_training_info(self) -> dict[str, list[float]]:
+        """Рассчитать показатели для всех тренировок набора."""
+        return compute_batch(self.workout_type, self.columns)
+
+    def messages(self) -> Iterator[InfoMessage]:
+        """Вернуть информационные сообщения по всем тренировкам."""
+        name = self.spec.training_class.__name__
+        result = self.show_training_info()
+        for values in zip(result['duration'], result['distance'],
+                          result['speed'], result['calories']):
+            yield InfoMessage(name, *values)
+
+    def _from_columns(self, columns: dict[str, array]) -> 'TrainingBatch':
+        batch = TrainingBatch(self.workout_type)
+        batch.columns = columns
+        return batch
+
+
+def group_packages(
+    packages: Iterable[tuple[str, list[float]]]
+) -> dict[str, TrainingBatch]:
+    """Разложить пакеты разных видов тренировок по наборам."""
+    batches: dict[str, TrainingBatch] = {}
+    for workout_type, data in packages:
+        if workout_type not in batches:
+            batches[workout_type] = TrainingBatch(workout_type)
+        batches[workout_type].append(data)
+    return batches
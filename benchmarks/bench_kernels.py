@@ -0,0 +1,51 @@
+"""Сравнение функций калорий с константами и расчёта через атрибуты.
+
+Запуск из корня репозитория: python -m benchmarks.bench_kernels
+"""
+import timeit
+
+import homework
+
+REPEAT = 7
+ARGS = {
+    'SWM': (1.0, 80, 1),
+    'RUN': (9.75, 75, 1),
+    'WLK': (5.85, 75, 1, 180),
+}
+
+
+def attribute_calories(training_class: type[homework.Training]):
+    """Расчёт калорий с поиском констант в атрибутах класса."""
+    cls = training_class
+    if cls is homework.Running:
+        return lambda speed, weight, duration: (
+            (cls.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+             + cls.CALORIES_MEAN_SPEED_SHIFT)
+            * weight / cls.M_IN_KM * duration * cls.MIN_IN_HOUR)
+    if cls is homework.SportsWalking:
+        return lambda speed, weight, duration, height: (
+            (cls.K1 * weight + ((speed * cls.K_KMH_TO_MS)**2
+             / (height / cls.CM_IN_M)) * cls.K2 * weight)
+            * duration * cls.MIN_IN_HOUR)
+    return lambda speed, weight, duration: (
+        (speed + cls.K3) * cls.K4 * weight * duration)
+
+
+def main(number: int = 200_000) -> None:
+    """Главная функция."""
+    for workout_type, args in ARGS.items():
+        training_class = homework.WORKOUT_REGISTRY[workout_type].training_class
+        reference = attribute_calories(training_class)
+        kernel = training_class.calories_kernel
+        assert reference(*args) == kernel(*args)
+        before = min(timeit.repeat(lambda: reference(*args),
+                                   number=number, repeat=REPEAT))
+        after = min(timeit.repeat(lambda: kernel(*args),
+                                  number=number, repeat=REPEAT))
+        print(f'{workout_type}: attributes {number / before:>12,.0f} ops/s, '
+              f'kernel {number / after:>12,.0f} ops/s, '
+              f'x{before / after:.2f}')
+
+
+if __name__ == '__main__':
+    main()
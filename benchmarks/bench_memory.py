@@ -0,0 +1,41 @@
+"""Замер памяти на один экземпляр тренировки: обычные и слотовые классы.
+
+Запуск из корня репозитория: python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+import homework
+
+COUNT = 100_000
+PACKAGES = {
+    'SWM': [720, 1, 80, 25, 40],
+    'RUN': [15000, 1, 75],
+    'WLK': [9000, 1, 75, 180],
+}
+
+
+def bytes_per_instance(workout_type: str, slotted: bool) -> float:
+    """Посчитать средний объём памяти на один экземпляр."""
+    data = PACKAGES[workout_type]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    trainings = [homework.read_package(workout_type, data, slotted=slotted)
+                 for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'lineno'))
+    del trainings
+    return size / COUNT
+
+
+def main() -> None:
+    """Вывести таблицу замеров."""
+    print(f'{"type":<6}{"dict, B":>10}{"slots, B":>10}')
+    for workout_type in PACKAGES:
+        print(f'{workout_type:<6}'
+              f'{bytes_per_instance(workout_type, False):>10.1f}'
+              f'{bytes_per_instance(workout_type, True):>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Замеры производительности по этапам обработки пакетов.
+
+Запуск из корня репозитория: python -m benchmarks.bench_pipeline
+"""
+import argparse
+import json
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import homework
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+PACKAGES = {
+    'SWM': [720, 1, 80, 25, 40],
+    'RUN': [15000, 1, 75],
+    'WLK': [9000, 1, 75, 180],
+}
+
+
+def measure(func: Callable[[], object], size: int) -> dict[str, float]:
+    """Замерить скорость и выделения памяти для size вызовов func."""
+    start = time.perf_counter()
+    for _ in range(size):
+        func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [func() for _ in range(min(size, 10_000))]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    allocated = sum(max(stat.size_diff, 0) for stat in stats)
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    return {'ops_per_sec': size / elapsed,
+            'bytes_per_op': allocated / len(results),
+            'blocks_per_op': blocks / len(results)}
+
+
+def stages() -> dict[str, Callable[[], object]]:
+    """Собрать замеряемые этапы для всех видов тренировок."""
+    result: dict[str, Callable[[], object]] = {}
+    for workout_type, data in PACKAGES.items():
+        training = homework.read_package(workout_type, data)
+        info = training.show_training_info()
+        result.update({
+            f'read_package[{workout_type}]':
+                lambda w=workout_type, d=data: homework.read_package(w, d),
+            f'check_correct_data[{workout_type}]':
+                lambda w=workout_type, d=data:
+                    homework.check_correct_data(w, d),
+            f'get_spent_calories[{workout_type}]':
+                training.get_spent_calories,
+            f'show_training_info[{workout_type}]':
+                training.show_training_info,
+            f'get_message[{workout_type}]': info.get_message,
+            f'isinstance[{workout_type}]':
+                lambda t=training: isinstance(t, homework.Training),
+        })
+    return result
+
+
+def git_revision() -> str:
+    """Вернуть текущий коммит или пустую строку."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def main() -> None:
+    """Главная функция."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--output', type=Path,
+                        default=BASE_DIR / 'benchmarks' / 'results.json')
+    parser.add_argument('--baseline', type=Path,
+                        help='JSON прошлого запуска для сравнения')
+    args = parser.parse_args()
+    baseline = {}
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())['results']
+    results = {}
+    for name, func in stages().items():
+        results[name] = measure(func, args.size)
+        line = (f'{name:<32}{results[name]["ops_per_sec"]:>14,.0f} ops/s'
+                f'{results[name]["bytes_per_op"]:>10.1f} B/op')
+        if name in baseline:
+            ratio = (results[name]['ops_per_sec']
+                     / baseline[name]['ops_per_sec'])
+            line += f'{ratio:>8.2f}x'
+        print(line)
+    args.output.write_text(json.dumps(
+        {'revision': git_revision(), 'size': args.size, 'results': results},
+        indent=2))
+
+
+if __name__ == '__main__':
+    main()
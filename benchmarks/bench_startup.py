@@ -0,0 +1,89 @@
+"""Замер времени запуска точек входа по сравнению с пустым Python.
+
+Исходный `homework.py` берётся из git (по умолчанию из первого коммита) и
+запускается из временного каталога, чтобы сравнить старую точку входа с
+текущими `homework.py` и `cli.py`.
+
+Запуск из корня репозитория: python -m benchmarks.bench_startup
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PACKAGES = b'SWM 720 1 80 25 40\nRUN 15000 1 75\nWLK 9000 1 75 180\n'
+COMMANDS = {
+    'python -c pass': [sys.executable, '-c', 'pass'],
+    'import homework': [sys.executable, '-c', 'import homework'],
+    'homework.py': [sys.executable, 'homework.py'],
+    'cli.py': [sys.executable, 'cli.py'],
+}
+
+
+def run_times(command: list[str], repeat: int,
+              cwd: Path = BASE_DIR) -> list[float]:
+    """Запустить команду repeat раз и вернуть длительности в мс."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, input=PACKAGES, cwd=cwd,
+                       stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def baseline_revision() -> str:
+    """Вернуть первый коммит репозитория."""
+    return subprocess.run(
+        ['git', 'rev-list', '--max-parents=0', 'HEAD'], cwd=BASE_DIR,
+        capture_output=True, text=True, check=True).stdout.split()[0]
+
+
+def write_baseline(revision: str, directory: Path) -> None:
+    """Сохранить homework.py из ревизии в каталог."""
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:homework.py'], cwd=BASE_DIR,
+        capture_output=True, check=True).stdout
+    (directory / 'homework.py').write_bytes(source)
+
+
+def import_time() -> int:
+    """Вернуть суммарное время импорта homework по -X importtime, мкс."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import homework'],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith('| homework'):
+            return int(line.split('|')[1])
+    return 0
+
+
+def main() -> None:
+    """Главная функция."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--baseline', help='ревизия исходного homework.py')
+    args = parser.parse_args()
+    revision = args.baseline or baseline_revision()
+    with tempfile.TemporaryDirectory() as directory:
+        write_baseline(revision, Path(directory))
+        times = run_times([sys.executable, 'homework.py'], args.repeat,
+                          Path(directory))
+    print(f'{"homework.py@" + revision[:7]:<20}'
+          f'median {statistics.median(times):7.1f} ms'
+          f'  min {min(times):7.1f} ms')
+    for name, command in COMMANDS.items():
+        times = run_times(command, args.repeat)
+        print(f'{name:<20}median {statistics.median(times):7.1f} ms'
+              f'  min {min(times):7.1f} ms')
+    imports = [import_time() for _ in range(args.repeat)]
+    print(f'{"homework import":<20}median '
+          f'{statistics.median(imports) / 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Командная строка: пакеты из файлов или stdin, сообщения в stdout.
+
+Использование: python cli.py [--format text|csv|ndjson] [--parallel N]
+[ФАЙЛ ...]. Без файлов или с `-` пакеты читаются из stdin, по одному на
+строку: `SWM 720 1 80 25 40`. Некорректные строки выводятся в stderr с
+номером строки, и код возврата становится 1.
+
+Время запуска по сравнению с исходным `python homework.py` не уменьшено:
+его почти целиком занимает импорт dataclasses (см.
+python -m benchmarks.bench_startup).
+"""
+import sys
+from typing import Iterable, Iterator, Optional, TextIO
+
+from homework import (MESSAGE_FORMATS, InfoMessage, PackageError,
+                      load_package, write_messages)
+
+USAGE = 'python cli.py [--format text|csv|ndjson] [--parallel N] [FILE ...]'
+
+
+def read_lines(paths: list[str]) -> Iterator[str]:
+    """Прочитать строки пакетов из файлов по очереди."""
+    for path in paths or ['-']:
+        if path == '-':
+            yield from sys.stdin
+            continue
+        with open(path, encoding='utf-8') as file:
+            yield from file
+
+
+def load_messages(lines: Iterable[str],
+                  errors: list[PackageError]) -> Iterator[InfoMessage]:
+    """Лениво рассчитать сообщения, сообщая об ошибках в stderr."""
+    for index, line in enumerate(lines):
+        training = load_package(index, line)
+        if training is None:
+            continue
+        if isinstance(training, PackageError):
+            errors.append(training)
+            print(f'{index}: {training.reason}', file=sys.stderr)
+            continue
+        try:
+            info = training.show_training_info()
+        except ArithmeticError as exc:
+            errors.append(PackageError(
+                index, line.split()[0],
+                [getattr(training, name) for name in training.__match_args__],
+                str(exc)))
+            print(f'{index}: {exc}', file=sys.stderr)
+            continue
+        yield info
+
+
+def parse_args(argv: list[str]) -> tuple[str, Optional[int], list[str]]:
+    """Разобрать аргументы командной строки."""
+    message_format = 'text'
+    workers: Optional[int] = None
+    paths: list[str] = []
+    args = iter(argv)
+    for arg in args:
+        if arg in ('-h', '--help'):
+            raise SystemExit(USAGE)
+        if arg == '--format':
+            message_format = next(args, '')
+            if message_format not in MESSAGE_FORMATS:
+                raise SystemExit(f'Неизвестный формат: {message_format}')
+        elif arg == '--parallel':
+            workers = int(next(args, '0'))
+        else:
+            paths.append(arg)
+    return message_format, workers, paths
+
+
+def main(argv: Optional[list[str]] = None,
+         stream: Optional[TextIO] = None) -> int:
+    """Главная функция."""
+    message_format, workers, paths = parse_args(
+        sys.argv[1:] if argv is None else argv)
+    lines = read_lines(paths)
+    if workers is None:
+        errors: list[PackageError] = []
+        write_messages(load_messages(lines, errors), stream, message_format)
+        return 1 if errors else 0
+    from parallel import process_packages_parallel
+    messages, errors = process_packages_parallel(lines, workers=workers)
+    write_messages(messages, stream, message_format)
+    for error in errors:
+        print(f'{error.index}: {error.reason}', file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
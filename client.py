@@ -0,0 +1,40 @@
+"""Тонкий клиент демона: пересылает пакеты из stdin в Unix-сокет.
+
+Импортирует только стандартную библиотеку и не загружает классы
+тренировок. Демон запускается командой `python server.py --unix PATH`;
+вместо этого клиента можно использовать и `nc -U PATH`, тогда запуск
+интерпретатора на каждое задание не нужен вовсе.
+"""
+import socket
+import sys
+import threading
+from typing import BinaryIO
+
+DEFAULT_SOCKET = '/tmp/homework.sock'
+
+
+def send_all(connection: socket.socket, source: BinaryIO) -> None:
+    """Переслать все строки источника и закрыть запись в сокет."""
+    try:
+        for line in source:
+            connection.sendall(line)
+    finally:
+        connection.shutdown(socket.SHUT_WR)
+
+
+def forward(path: str, source: BinaryIO, target: BinaryIO) -> None:
+    """Переслать пакеты демону и записать его ответы."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        sender = threading.Thread(target=send_all,
+                                  args=(connection, source), daemon=True)
+        sender.start()
+        while chunk := connection.recv(65536):
+            target.write(chunk)
+        sender.join()
+    target.flush()
+
+
+if __name__ == '__main__':
+    forward(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOCKET,
+            sys.stdin.buffer, sys.stdout.buffer)
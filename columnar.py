@@ -0,0 +1,94 @@
+"""Колоночный бинарный формат пакетов с чтением через mmap.
+
+Файл состоит из заголовка `<4s3sBQ` (сигнатура, код тренировки, число
+полей, число записей) и следующих за ним колонок float64 в порядке полей
+класса тренировки из реестра. Код тренировки хранится ровно в трёх
+байтах ASCII, поэтому коды другой длины не записываются.
+"""
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Sequence, Union
+
+from homework import WORKOUT_REGISTRY, WorkoutSpec, compute_batch
+
+MAGIC = b'TRNC'
+HEADER = struct.Struct('<4s3sBQ')
+CODE_SIZE = 3
+ITEM_SIZE = 8
+
+PathLike = Union[str, Path]
+
+
+def write_columns(path: PathLike, workout_type: str,
+                  columns: dict[str, Sequence[float]]) -> int:
+    """Записать колонки пакетов одного вида тренировки в файл."""
+    spec = WORKOUT_REGISTRY[workout_type]
+    if len(workout_type) != CODE_SIZE or not workout_type.isascii():
+        raise ValueError(f'Код тренировки {workout_type!r} должен состоять '
+                         f'из {CODE_SIZE} символов ASCII')
+    size = len(columns[spec.fields[0]])
+    for name in spec.fields:
+        if len(columns[name]) != size:
+            raise ValueError(f'Длина колонки {name} не равна {size}')
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, workout_type.encode('ascii'),
+                               spec.arity, size))
+        for name in spec.fields:
+            file.write(array('d', columns[name]).tobytes())
+    return size
+
+
+class ColumnFile:
+    """Файл колонок, отображённый в память без копирования данных."""
+
+    def __init__(self, path: PathLike) -> None:
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                raise ValueError('Пустой файл колонок')
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            spec, size = self._read_header()
+        except BaseException:
+            self._mmap.close()
+            raise
+        self.size = size
+        self._buffer = memoryview(self._mmap)
+        self.columns: dict[str, memoryview] = {}
+        for index, name in enumerate(spec.fields):
+            start = HEADER.size + index * size * ITEM_SIZE
+            self.columns[name] = (
+                self._buffer[start:start + size * ITEM_SIZE].cast('d'))
+
+    def _read_header(self) -> tuple[WorkoutSpec, int]:
+        """Проверить заголовок и вернуть описание тренировки и число строк."""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError('Файл короче заголовка колонок')
+        magic, code, arity, size = HEADER.unpack_from(self._mmap)
+        self.workout_type = code.decode('ascii', errors='replace')
+        spec = WORKOUT_REGISTRY.get(self.workout_type)
+        if magic != MAGIC or spec is None or spec.arity != arity:
+            raise ValueError('Ошибка формата файла колонок')
+        if len(self._mmap) != HEADER.size + arity * size * ITEM_SIZE:
+            raise ValueError('Размер файла не совпадает с заголовком')
+        return spec, size
+
+    def compute(self) -> dict[str, list[float]]:
+        """Рассчитать показатели по колонкам файла."""
+        return compute_batch(self.workout_type, self.columns)
+
+    def close(self) -> None:
+        """Освободить представления колонок и закрыть отображение."""
+        for column in self.columns.values():
+            column.release()
+        self.columns.clear()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'ColumnFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
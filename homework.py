@@ -1,8 +1,16 @@
-from typing import Any, ClassVar
+from typing import (Any, Callable, ClassVar, Iterable, Iterator, Optional,
+                    Sequence, TextIO, Union)
+import dataclasses
+import math
+from abc import ABCMeta
+import os
+import sys
 from dataclasses import dataclass
+from functools import cache
+from itertools import islice
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoMessage ():
     """Информационное сообщение о тренировке."""
     training_type: str
@@ -19,8 +27,13 @@ class InfoMessage ():
                 f'Потрачено ккал: {self.calories:.3f}.')
 
 
+def defining_class(cls: type, name: str) -> type:
+    """Вернуть класс из MRO, в котором определён атрибут."""
+    return next(owner for owner in cls.__mro__ if name in vars(owner))
+
+
 @dataclass
-class Training:
+class Training(metaclass=ABCMeta):
     """Базовый класс тренировки."""
     action: int
     duration: float
@@ -28,6 +41,26 @@ class Training:
     M_IN_KM: ClassVar[int] = 1000
     LEN_STEP: ClassVar[float] = 0.65
     MIN_IN_HOUR: ClassVar[int] = 60
+    CALORIES_ARGS: ClassVar[tuple[str, ...]] = ('weight', 'duration')
+    calories_kernel: ClassVar[Optional[Callable[..., float]]] = None
+    SPEED_FROM_DISTANCE: ClassVar[bool] = True
+    CALORIES_FROM_SPEED: ClassVar[bool] = False
+
+    def __init_subclass__(cls) -> None:
+        """Собрать функцию калорий и выбрать быстрый путь расчёта."""
+        kernel = cls.build_calories_kernel()
+        if kernel is not None:
+            cls.calories_kernel = staticmethod(kernel)
+        cls.SPEED_FROM_DISTANCE = (cls.get_mean_speed
+                                   is Training.get_mean_speed)
+        cls.CALORIES_FROM_SPEED = issubclass(
+            defining_class(cls, 'get_spent_calories_for'),
+            defining_class(cls, 'get_spent_calories'))
+
+    @classmethod
+    def build_calories_kernel(cls) -> Optional[Callable[..., float]]:
+        """Построить функцию калорий от скорости и полей CALORIES_ARGS."""
+        return None
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
@@ -41,13 +74,60 @@ class Training:
         """Получить количество затраченных калорий."""
         raise NotImplementedError('Такого быть не должно')
 
+    def get_spent_calories_for(self, speed: float) -> float:
+        """Получить калории по уже рассчитанной средней скорости.
+
+        Переопределяется вместе с get_spent_calories; если подкласс
+        переопределил только get_spent_calories, compute_metrics вызывает
+        его напрямую.
+        """
+        return self.get_spent_calories()
+
+    def compute_metrics(self) -> tuple[float, float, float, float]:
+        """Рассчитать длительность, дистанцию, скорость и калории за раз.
+
+        Дистанция используется повторно для скорости, только если класс не
+        переопределяет get_mean_speed, а скорость для калорий - только если
+        get_spent_calories_for не старше get_spent_calories.
+        """
+        distance = self.get_distance()
+        if self.SPEED_FROM_DISTANCE:
+            speed = distance / self.duration
+        else:
+            speed = self.get_mean_speed()
+        if self.CALORIES_FROM_SPEED:
+            calories = self.get_spent_calories_for(speed)
+        else:
+            calories = self.get_spent_calories()
+        return (self.duration, distance, speed, calories)
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(self.__class__.__name__,
-                           self.duration,
-                           self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories())
+        return InfoMessage(self.__class__.__name__, *self.compute_metrics())
+
+    @classmethod
+    def get_batch_distance(cls, columns: dict[str, Sequence]) -> list[float]:
+        """Получить дистанцию в км для колонок данных."""
+        return [action * cls.LEN_STEP / cls.M_IN_KM
+                for action in columns['action']]
+
+    @classmethod
+    def get_batch_mean_speed(cls,
+                             columns: dict[str, Sequence]) -> list[float]:
+        """Получить среднюю скорость для колонок данных."""
+        return [distance / duration
+                for distance, duration in zip(cls.get_batch_distance(columns),
+                                              columns['duration'])]
+
+    @classmethod
+    def get_batch_spent_calories(cls,
+                                 columns: dict[str, Sequence]) -> list[float]:
+        """Получить затраченные калории для колонок данных."""
+        if cls.calories_kernel is None:
+            raise NotImplementedError('Такого быть не должно')
+        return list(map(cls.calories_kernel,
+                        cls.get_batch_mean_speed(columns),
+                        *(columns[name] for name in cls.CALORIES_ARGS)))
 
 
 @dataclass
@@ -56,13 +136,27 @@ class Running(Training):
     CALORIES_MEAN_SPEED_MULTIPLIER: ClassVar[int] = 18
     CALORIES_MEAN_SPEED_SHIFT: ClassVar[float] = 1.79
 
+    @classmethod
+    def build_calories_kernel(cls) -> Callable[..., float]:
+        """Построить функцию калорий с подставленными константами."""
+        multiplier = cls.CALORIES_MEAN_SPEED_MULTIPLIER
+        shift = cls.CALORIES_MEAN_SPEED_SHIFT
+        m_in_km = cls.M_IN_KM
+        min_in_hour = cls.MIN_IN_HOUR
+
+        def kernel(speed: float, weight: float, duration: float) -> float:
+            return ((multiplier * speed + shift)
+                    * weight / m_in_km
+                    * duration * min_in_hour)
+        return kernel
+
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER
-                 * self.get_mean_speed()
-                 + self.CALORIES_MEAN_SPEED_SHIFT)
-                * self.weight / self.M_IN_KM
-                * self.duration * self.MIN_IN_HOUR)
+        return self.get_spent_calories_for(self.get_mean_speed())
+
+    def get_spent_calories_for(self, speed: float) -> float:
+        """Получить калории по уже рассчитанной средней скорости."""
+        return self.calories_kernel(speed, self.weight, self.duration)
 
 
 @dataclass
@@ -74,13 +168,34 @@ class SportsWalking(Training):
     CALORIES_MEAN_SPEED_SHIFT: ClassVar[float] = 1.79
     K_KMH_TO_MS: ClassVar[float] = 0.278
     CM_IN_M: ClassVar[int] = 100
+    CALORIES_ARGS: ClassVar[tuple[str, ...]] = ('weight', 'duration',
+                                                'height')
     height: float
 
+    @classmethod
+    def build_calories_kernel(cls) -> Callable[..., float]:
+        """Построить функцию калорий с подставленными константами."""
+        k1 = cls.K1
+        k2 = cls.K2
+        kmh_to_ms = cls.K_KMH_TO_MS
+        cm_in_m = cls.CM_IN_M
+        min_in_hour = cls.MIN_IN_HOUR
+
+        def kernel(speed: float, weight: float, duration: float,
+                   height: float) -> float:
+            return ((k1 * weight + ((speed * kmh_to_ms)**2
+                    / (height / cm_in_m)) * k2 * weight)
+                    * duration * min_in_hour)
+        return kernel
+
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.K1 * self.weight + ((self.get_mean_speed()
-                * self.K_KMH_TO_MS)**2 / (self.height / self.CM_IN_M))
-                * self.K2 * self.weight) * self.duration * self.MIN_IN_HOUR)
+        return self.get_spent_calories_for(self.get_mean_speed())
+
+    def get_spent_calories_for(self, speed: float) -> float:
+        """Получить калории по уже рассчитанной средней скорости."""
+        return self.calories_kernel(speed, self.weight, self.duration,
+                                    self.height)
 
 
 @dataclass
@@ -97,37 +212,305 @@ class Swimming(Training):
         return (self.length_pool * self.count_pool
                 / self.M_IN_KM / self.duration)
 
+    @classmethod
+    def build_calories_kernel(cls) -> Callable[..., float]:
+        """Построить функцию калорий с подставленными константами."""
+        k3 = cls.K3
+        k4 = cls.K4
+
+        def kernel(speed: float, weight: float, duration: float) -> float:
+            return (speed + k3) * k4 * weight * duration
+        return kernel
+
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.get_mean_speed() + self.K3) * self.K4
-                * self.weight * self.duration)
+        return self.get_spent_calories_for(self.get_mean_speed())
+
+    def get_spent_calories_for(self, speed: float) -> float:
+        """Получить калории по уже рассчитанной средней скорости."""
+        return self.calories_kernel(speed, self.weight, self.duration)
+
+    @classmethod
+    def get_batch_mean_speed(cls,
+                             columns: dict[str, Sequence]) -> list[float]:
+        """Получить среднюю скорость для колонок данных."""
+        return [length_pool * count_pool / cls.M_IN_KM / duration
+                for length_pool, count_pool, duration in zip(
+                    columns['length_pool'],
+                    columns['count_pool'],
+                    columns['duration'])]
+
+
+DATACLASS_ATTRS: frozenset[str] = frozenset({
+    '__dict__', '__weakref__', '__init__', '__repr__', '__eq__', '__hash__',
+    '__match_args__', '__dataclass_fields__', '__dataclass_params__',
+    '_abc_impl', '__abstractmethods__'
+})
+SLOTTED_PREFIX = 'Slotted'
+
+
+@cache
+def make_slotted(training_class: type[Training]) -> type[Training]:
+    """Построить вариант класса тренировки со __slots__ вместо __dict__.
+
+    Вариант называется `Slotted<Имя>` в __qualname__ и repr, а в
+    сообщениях остаётся исходное имя. Экземпляры сохраняются в pickle
+    через build_slotted. Сам класс находится по имени модуля: для homework
+    через __getattr__, для классов верхнего уровня других модулей - через
+    атрибут, который добавляется в их модуль при построении варианта.
+    """
+    base = training_class.__base__
+    bases = (make_slotted(base),) if issubclass(base, Training) else ()
+    namespace = {key: value for key, value in vars(training_class).items()
+                 if key not in DATACLASS_ATTRS}
+    qualname = SLOTTED_PREFIX + training_class.__qualname__
+    namespace['__qualname__'] = qualname
+
+    def __reduce__(self: Training) -> tuple[Callable[..., Training], tuple]:
+        return build_slotted, (training_class, tuple(
+            getattr(self, name) for name in self.__match_args__))
+
+    namespace['__reduce__'] = __reduce__
+    slotted = dataclass(slots=True)(
+        type(training_class)(training_class.__name__, bases, namespace))
+    training_class.register(slotted)
+    module = sys.modules.get(training_class.__module__)
+    if (module is not None and module.__name__ != __name__
+            and '.' not in qualname and '<' not in qualname):
+        setattr(module, qualname, slotted)
+    return slotted
+
+
+def build_slotted(training_class: type[Training],
+                  data: Sequence[Any]) -> Training:
+    """Создать слотовую тренировку; используется при распаковке pickle."""
+    return make_slotted(training_class)(*data)
+
+
+def __getattr__(name: str) -> type[Training]:
+    """Найти слотовый вариант класса модуля по имени из __qualname__."""
+    if name.startswith(SLOTTED_PREFIX):
+        training_class = globals().get(name[len(SLOTTED_PREFIX):])
+        if (isinstance(training_class, type)
+                and issubclass(training_class, Training)):
+            return make_slotted(training_class)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+@dataclass(frozen=True, slots=True)
+class WorkoutSpec:
+    """Описание вида тренировки в реестре."""
+    training_class: type[Training]
+    fields: tuple[str, ...]
+    arity: int
+
+    @property
+    def slotted_class(self) -> type[Training]:
+        """Слотовый вариант класса, создаётся при первом обращении."""
+        return make_slotted(self.training_class)
+
 
+WORKOUT_REGISTRY: dict[str, WorkoutSpec] = {}
 
-def read_package(workout_type: str, data: list[int]) -> Training:
+
+def register_workout(workout_type: str,
+                     training_class: type[Training]) -> type[Training]:
+    """Зарегистрировать класс тренировки под кодом вида спорта."""
+    fields = tuple(spec.name for spec in dataclasses.fields(training_class)
+                   if spec.init)
+    WORKOUT_REGISTRY[workout_type] = WorkoutSpec(
+        training_class, fields, len(fields))
+    return training_class
+
+
+register_workout('SWM', Swimming)
+register_workout('RUN', Running)
+register_workout('WLK', SportsWalking)
+
+
+def read_package(workout_type: str, data: list[int],
+                 slotted: bool = False) -> Training:
     """Прочитать данные полученные от датчиков."""
     data_status = check_correct_data(workout_type, data)
-    WORK_TYPE: dict[str, type[Training]] = {'SWM': Swimming,
-                                            'RUN': Running,
-                                            'WLK': SportsWalking}
     if data_status:
-        return WORK_TYPE[workout_type](*data)
+        spec = WORKOUT_REGISTRY[workout_type]
+        if slotted:
+            return spec.slotted_class(*data)
+        return spec.training_class(*data)
     else:
         raise NameError('Ошибка полученных данных')
 
 
-def check_correct_data(workout_type: str, data: list[Any]):
+def check_correct_data(workout_type: str, data: list[Any]) -> bool:
     """Проверка корректности полученного пакета."""
-    DATA_MASK: dict[str, int] = {
-        'SWM': 5,
-        'RUN': 3,
-        'WLK': 4
-    }
-    data_status: bool = False
-    if workout_type in DATA_MASK and len(data) == DATA_MASK[workout_type]:
-        for info in data:
-            if info is not None:
-                data_status = True
-    return data_status
+    spec = WORKOUT_REGISTRY.get(workout_type)
+    return (spec is not None and len(data) == spec.arity
+            and any(info is not None for info in data))
+
+
+@dataclass(slots=True)
+class PackageError:
+    """Ошибка обработки пакета с его позицией во входных данных."""
+    index: int
+    workout_type: str
+    data: list[Any]
+    reason: str
+
+
+POSITIVE_FIELDS: frozenset[str] = frozenset({'duration', 'height'})
+
+
+def find_data_error(workout_type: str, data: Sequence[Any]) -> str:
+    """Вернуть причину некорректности пакета или пустую строку."""
+    spec = (WORKOUT_REGISTRY.get(workout_type)
+            if isinstance(workout_type, str) else None)
+    if spec is None:
+        return f'Неизвестный вид тренировки {workout_type}'
+    if not isinstance(data, (list, tuple)):
+        return 'Данные пакета должны быть списком'
+    if len(data) != spec.arity:
+        return f'Ожидалось полей: {spec.arity}, получено: {len(data)}'
+    for name, value in zip(spec.fields, data):
+        if value is None:
+            return f'Не заполнено поле {name}'
+        if (not isinstance(value, (int, float)) or isinstance(value, bool)
+                or not math.isfinite(value)):
+            return f'Поле {name} должно быть конечным числом'
+        if value < 0 or (value == 0 and name in POSITIVE_FIELDS):
+            return f'Недопустимое значение поля {name}: {value}'
+    return ''
+
+
+def validate_packages(
+    packages: Iterable[tuple[str, Sequence[Any]]]
+) -> tuple[list[bool], list[PackageError]]:
+    """Проверить пакеты и вернуть маску корректных и список ошибок."""
+    mask: list[bool] = []
+    errors: list[PackageError] = []
+    for index, (workout_type, data) in enumerate(packages):
+        reason = find_data_error(workout_type, data)
+        mask.append(not reason)
+        if reason:
+            errors.append(PackageError(
+                index, str(workout_type),
+                list(data) if isinstance(data, (list, tuple)) else [data],
+                reason))
+    return mask, errors
+
+
+def compute_batch(workout_type: str,
+                  columns: dict[str, Sequence]) -> dict[str, list[float]]:
+    """Рассчитать показатели тренировок по колонкам данных."""
+    if workout_type not in WORKOUT_REGISTRY:
+        raise NameError('Ошибка полученных данных')
+    training_class = WORKOUT_REGISTRY[workout_type].training_class
+    return {'duration': list(columns['duration']),
+            'distance': training_class.get_batch_distance(columns),
+            'speed': training_class.get_batch_mean_speed(columns),
+            'calories': training_class.get_batch_spent_calories(columns)}
+
+
+def parse_package(line: str) -> tuple[str, list[float]]:
+    """Разобрать строку пакета вида `SWM 720 1 80 25 40`."""
+    workout_type, *values = line.split()
+    data: list[float] = []
+    for value in values:
+        try:
+            data.append(int(value))
+        except ValueError:
+            data.append(float(value))
+    return workout_type, data
+
+
+def load_package(
+    index: int, package: Union[str, tuple[str, list[float]]]
+) -> Union[Training, PackageError, None]:
+    """Разобрать и проверить пакет, вернув тренировку или ошибку.
+
+    Пустая строка даёт None, любой некорректный пакет - PackageError.
+    """
+    if isinstance(package, str):
+        if not package.strip():
+            return None
+        try:
+            package = parse_package(package)
+        except ValueError as exc:
+            return PackageError(index, package.split()[0], [],
+                                f'Ошибка разбора пакета: {exc}')
+    try:
+        workout_type, data = package
+    except (TypeError, ValueError):
+        return PackageError(index, '', [],
+                            'Пакет должен быть парой (код, данные)')
+    reason = find_data_error(workout_type, data)
+    if reason:
+        return PackageError(
+            index, str(workout_type),
+            list(data) if isinstance(data, (list, tuple)) else [data],
+            reason)
+    return read_package(workout_type, data)
+
+
+def stream_packages(
+    source: Iterable[Union[str, tuple[str, list[float]]]]
+) -> Iterator[InfoMessage]:
+    """Лениво обработать пакеты из итерируемого источника или файла."""
+    for package in source:
+        if isinstance(package, str):
+            if not package.strip():
+                continue
+            package = parse_package(package)
+        workout_type, data = package
+        yield read_package(workout_type, data).show_training_info()
+
+
+MESSAGE_FIELDS: tuple[str, ...] = ('training_type', 'duration', 'distance',
+                                   'speed', 'calories')
+
+
+def format_csv_header() -> str:
+    """Вернуть строку заголовка CSV."""
+    return ','.join(MESSAGE_FIELDS)
+
+
+def format_csv(info: InfoMessage) -> str:
+    """Вернуть сообщение в виде строки CSV."""
+    return (f'{info.training_type},{info.duration!r},{info.distance!r},'
+            f'{info.speed!r},{info.calories!r}')
+
+
+def format_ndjson(info: InfoMessage) -> str:
+    """Вернуть сообщение в виде строки NDJSON."""
+    import json
+    return json.dumps(dict(zip(MESSAGE_FIELDS,
+                               (info.training_type, info.duration,
+                                info.distance, info.speed, info.calories))))
+
+
+MESSAGE_FORMATS: dict[str, Callable[[InfoMessage], str]] = {
+    'text': InfoMessage.get_message,
+    'csv': format_csv,
+    'ndjson': format_ndjson,
+}
+
+
+def write_messages(messages: Iterable[InfoMessage],
+                   stream: Optional[TextIO] = None,
+                   message_format: str = 'text',
+                   chunk_size: int = 1024,
+                   header: bool = True) -> int:
+    """Записать сообщения в поток блоками и вернуть их количество."""
+    if stream is None:
+        stream = sys.stdout
+    formatter = MESSAGE_FORMATS[message_format]
+    if header and message_format == 'csv':
+        stream.write(format_csv_header() + '\n')
+    iterator = iter(messages)
+    written = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        stream.write('\n'.join(map(formatter, chunk)) + '\n')
+        written += len(chunk)
+    return written
 
 
 def main(training: Training) -> None:
@@ -136,6 +519,11 @@ def main(training: Training) -> None:
     print(info.get_message())
 
 
+if os.environ.get('HOMEWORK_INSTRUMENT'):
+    import instrumentation
+    instrumentation.enable(sys.modules[__name__])
+
+
 if __name__ == '__main__':
     packages = [
         ('SWM', [720, 1, 80, 25, 40]),
@@ -143,6 +531,4 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    write_messages(stream_packages(packages))
@@ -0,0 +1,127 @@
+"""Необязательные счётчики и гистограммы задержек по этапам обработки.
+
+Пока инструментирование выключено, модуль homework работает с исходными
+функциями и методами. `enable()` подменяет их обёртками на месте, поэтому
+вызывающий код менять не нужно, если он обращается к ним через модуль
+(`homework.read_package`), а не через `from homework import read_package`.
+В процессах пула parallel инструментирование включается только через
+HOMEWORK_INSTRUMENT, и счётчики остаются в этих процессах.
+"""
+import time
+from functools import wraps
+from types import ModuleType
+from typing import Callable, Optional
+
+STAGES: tuple[str, ...] = ('check_correct_data', 'read_package',
+                           'get_spent_calories', 'get_message')
+BUCKETS: int = 32
+
+StartHook = Callable[[str], None]
+EndHook = Callable[[str, int], None]
+
+HOOKS: dict[str, list[Callable]] = {'start': [], 'end': []}
+_counts: dict[str, int] = dict.fromkeys(STAGES, 0)
+_totals: dict[str, int] = dict.fromkeys(STAGES, 0)
+_histograms: dict[str, list[int]] = {stage: [0] * BUCKETS for stage in STAGES}
+_originals: list[tuple[object, str, object]] = []
+
+
+def register_hook(phase: str, callback: Callable) -> None:
+    """Подписать функцию на начало ('start') или конец ('end') этапа."""
+    HOOKS[phase].append(callback)
+
+
+def unregister_hook(phase: str, callback: Callable) -> None:
+    """Отписать функцию от событий этапа."""
+    HOOKS[phase].remove(callback)
+
+
+def record(stage: str, elapsed_ns: int) -> None:
+    """Учесть длительность вызова этапа в наносекундах."""
+    _counts[stage] += 1
+    _totals[stage] += elapsed_ns
+    bucket = min(elapsed_ns.bit_length(), BUCKETS - 1)
+    _histograms[stage][bucket] += 1
+
+
+def instrument(stage: str, func: Callable) -> Callable:
+    """Обернуть функцию замером времени и вызовом подписчиков."""
+    start_hooks = HOOKS['start']
+    end_hooks = HOOKS['end']
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for hook in start_hooks:
+            hook(stage)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            record(stage, elapsed)
+            for hook in end_hooks:
+                hook(stage, elapsed)
+    return wrapper
+
+
+def patch(owner: object, name: str, stage: str) -> None:
+    """Заменить атрибут или элемент словаря обёрткой с замером."""
+    if isinstance(owner, dict):
+        original = owner[name]
+        owner[name] = instrument(stage, original)
+    else:
+        original = getattr(owner, name)
+        setattr(owner, name, instrument(stage, original))
+    _originals.append((owner, name, original))
+
+
+def enable(module: Optional[ModuleType] = None) -> None:
+    """Включить инструментирование модуля homework."""
+    if _originals:
+        return
+    if module is None:
+        import homework as module
+    patch(module, 'check_correct_data', 'check_correct_data')
+    patch(module, 'read_package', 'read_package')
+    patch(module.InfoMessage, 'get_message', 'get_message')
+    patch(module.MESSAGE_FORMATS, 'text', 'get_message')
+    for spec in module.WORKOUT_REGISTRY.values():
+        for training_class in (spec.training_class, spec.slotted_class):
+            name = ('get_spent_calories_for'
+                    if training_class.CALORIES_FROM_SPEED
+                    else 'get_spent_calories')
+            patch(training_class, name, 'get_spent_calories')
+
+
+def disable() -> None:
+    """Вернуть исходные функции и методы."""
+    while _originals:
+        owner, name, original = _originals.pop()
+        if isinstance(owner, dict):
+            owner[name] = original
+        else:
+            setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """Проверить, включено ли инструментирование."""
+    return bool(_originals)
+
+
+def reset() -> None:
+    """Обнулить счётчики и гистограммы."""
+    for stage in STAGES:
+        _counts[stage] = _totals[stage] = 0
+        _histograms[stage] = [0] * BUCKETS
+
+
+def snapshot() -> dict[str, dict]:
+    """Вернуть счётчики и гистограммы задержек по этапам.
+
+    Ключ гистограммы - верхняя граница корзины в наносекундах.
+    """
+    return {stage: {'count': _counts[stage],
+                    'total_ns': _totals[stage],
+                    'histogram': {1 << bucket: hits for bucket, hits
+                                  in enumerate(_histograms[stage]) if hits}}
+            for stage in STAGES}
@@ -0,0 +1,126 @@
+"""Потоковая загрузка пакетов из CSV и NDJSON блоками."""
+import csv
+import json
+from dataclasses import replace
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO, Union
+
+from batch import TrainingBatch, group_packages
+from homework import WORKOUT_REGISTRY, PackageError, validate_packages
+
+Package = tuple[str, list]
+LoadedPackage = Union[Package, PackageError]
+
+
+def to_number(value: str) -> float:
+    """Преобразовать значение ячейки в число."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def iter_csv_packages(file: TextIO) -> Iterator[LoadedPackage]:
+    """Прочитать пакеты из CSV.
+
+    Строка с заголовком `workout_type,...` задаёт имена колонок, иначе
+    значения идут после кода тренировки в порядке полей класса. Строка,
+    которую не удалось разобрать, даёт PackageError с номером пакета.
+    """
+    reader = csv.reader(file)
+    header = None
+    index = 0
+    for row in reader:
+        if not row:
+            continue
+        if header is None and row[0] == 'workout_type':
+            header = {name: position for position, name in enumerate(row)}
+            continue
+        package: LoadedPackage
+        try:
+            package = csv_package(row, header)
+        except ValueError as exc:
+            package = PackageError(index, row[0], row[1:],
+                                   f'Ошибка разбора пакета: {exc}')
+        yield package
+        index += 1
+
+
+def csv_package(row: list[str], header: Optional[dict[str, int]]) -> Package:
+    """Собрать пакет из строки CSV; пропущенные ячейки дают None."""
+    workout_type = row[0]
+    if header is None:
+        return workout_type, [to_number(value) for value in row[1:]]
+    spec = WORKOUT_REGISTRY.get(workout_type)
+    if spec is None:
+        return workout_type, []
+    values = []
+    for name in spec.fields:
+        position = header.get(name)
+        cell = (row[position] if position is not None and position < len(row)
+                else '')
+        values.append(to_number(cell) if cell else None)
+    return workout_type, values
+
+
+def iter_ndjson_packages(file: TextIO) -> Iterator[LoadedPackage]:
+    """Прочитать пакеты из NDJSON: объект с полями или пара [код, данные].
+
+    Некорректная строка или запись другого вида даёт PackageError.
+    """
+    index = 0
+    for line in file:
+        if not line.strip():
+            continue
+        package: LoadedPackage
+        try:
+            package = ndjson_package(json.loads(line))
+        except ValueError as exc:
+            package = PackageError(index, '', [line.strip()],
+                                   f'Ошибка разбора пакета: {exc}')
+        yield package
+        index += 1
+
+
+def ndjson_package(record: object) -> Package:
+    """Собрать пакет из записи NDJSON."""
+    if isinstance(record, list) and len(record) == 2:
+        return record[0], record[1]
+    if not isinstance(record, dict):
+        raise ValueError('ожидался объект или пара [код, данные]')
+    workout_type = record.get('workout_type')
+    spec = (WORKOUT_REGISTRY.get(workout_type)
+            if isinstance(workout_type, str) else None)
+    fields = spec.fields if spec is not None else ()
+    return workout_type, [record.get(name) for name in fields]
+
+
+def load_batches(
+    packages: Iterable[LoadedPackage], chunk_size: int = 65536
+) -> Iterator[tuple[dict[str, TrainingBatch], list[PackageError]]]:
+    """Разбить поток пакетов на проверенные наборы по видам тренировок.
+
+    Номера ошибок считаются по всему потоку, включая пакеты, которые не
+    удалось разобрать.
+    """
+    iterator = iter(packages)
+    offset = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        errors: list[PackageError] = []
+        packages_chunk: list[Package] = []
+        positions: list[int] = []
+        for position, package in enumerate(chunk, offset):
+            if isinstance(package, PackageError):
+                errors.append(replace(package, index=position))
+            else:
+                packages_chunk.append(package)
+                positions.append(position)
+        mask, invalid = validate_packages(packages_chunk)
+        errors.extend(replace(error, index=positions[error.index])
+                      for error in invalid)
+        errors.sort(key=lambda error: error.index)
+        batches = group_packages(
+            package for package, valid in zip(packages_chunk, mask)
+            if valid)
+        yield batches, errors
+        offset += len(chunk)
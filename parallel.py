@@ -0,0 +1,231 @@
+"""Параллельная обработка больших наборов пакетов."""
+import os
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import count, islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, Optional, Sized, Union
+
+from homework import (WORKOUT_REGISTRY, InfoMessage, PackageError,
+                      load_package)
+
+Package = Union[str, tuple[str, list[float]]]
+ChunkResult = tuple[list[InfoMessage], list[PackageError]]
+
+
+def process_chunk(start: int, chunk: list[Package]) -> ChunkResult:
+    """Обработать блок пакетов, собирая ошибки вместо исключений."""
+    messages: list[InfoMessage] = []
+    errors: list[PackageError] = []
+    for index, package in zip(count(start), chunk):
+        training = load_package(index, package)
+        if training is None:
+            continue
+        if isinstance(training, PackageError):
+            errors.append(training)
+            continue
+        try:
+            messages.append(training.show_training_info())
+        except ArithmeticError as exc:
+            errors.append(PackageError(
+                index, package_type(package),
+                [getattr(training, name) for name in training.__match_args__],
+                str(exc)))
+    return messages, errors
+
+
+def package_type(package: Package) -> str:
+    """Вернуть код тренировки из пакета или строки пакета."""
+    if isinstance(package, str):
+        return package.split()[0]
+    return package[0]
+
+
+def iter_chunks(source: Iterable[Package],
+                chunk_size: int) -> Iterator[tuple[int, list[Package]]]:
+    """Разбить источник пакетов на блоки с номером первого пакета."""
+    iterator = iter(source)
+    start = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def process_packages_parallel(source: Iterable[Package],
+                              workers: Optional[int] = None,
+                              chunk_size: int = 10_000) -> ChunkResult:
+    """Обработать пакеты в пуле процессов с сохранением порядка."""
+    workers = workers or os.cpu_count() or 1
+    messages: list[InfoMessage] = []
+    errors: list[PackageError] = []
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, chunk in iter_chunks(source, chunk_size):
+            pending.append(executor.submit(process_chunk, start, chunk))
+            if len(pending) >= 2 * workers:
+                collect(pending.popleft(), messages, errors)
+        while pending:
+            collect(pending.popleft(), messages, errors)
+    return messages, errors
+
+
+def collect(future: Future, messages: list[InfoMessage],
+            errors: list[PackageError]) -> None:
+    """Добавить результат блока к общим спискам."""
+    chunk_messages, chunk_errors = future.result()
+    messages.extend(chunk_messages)
+    errors.extend(chunk_errors)
+
+
+RESULT_COLUMNS: tuple[str, ...] = ('duration', 'distance', 'speed',
+                                   'calories')
+ITEM_SIZE = 8
+ROW_SIZE = len(RESULT_COLUMNS) * ITEM_SIZE + 2
+
+
+def column_views(buffer: memoryview, size: int) -> dict[str, memoryview]:
+    """Разметить общий буфер на колонки float64, статус и код тренировки."""
+    views = {name: buffer[index * size * ITEM_SIZE:
+                          (index + 1) * size * ITEM_SIZE].cast('d')
+             for index, name in enumerate(RESULT_COLUMNS)}
+    offset = len(RESULT_COLUMNS) * size * ITEM_SIZE
+    views['status'] = buffer[offset:offset + size]
+    views['code'] = buffer[offset + size:offset + 2 * size]
+    return views
+
+
+def release_shared(shared: SharedMemory, views: dict[str, memoryview],
+                   unlink: bool) -> None:
+    """Освободить представления колонок и закрыть общую память."""
+    for view in views.values():
+        view.release()
+    views.clear()
+    shared.close()
+    if unlink:
+        shared.unlink()
+
+
+def fill_shared_chunk(name: str, size: int, start: int,
+                      chunk: list[Package],
+                      codes: tuple[str, ...]) -> list[PackageError]:
+    """Записать результаты блока в общую память по своим смещениям.
+
+    Рядом со статусом пишется номер кода тренировки в codes.
+    """
+    shared = SharedMemory(name=name)
+    views = column_views(shared.buf, size)
+    code_numbers = {code: number for number, code in enumerate(codes)}
+    errors: list[PackageError] = []
+    try:
+        status = views['status']
+        code_column = views['code']
+        columns = [views[name] for name in RESULT_COLUMNS]
+        for index, package in zip(count(start), chunk):
+            training = load_package(index, package)
+            if training is None:
+                continue
+            if isinstance(training, PackageError):
+                errors.append(training)
+                continue
+            try:
+                info = training.show_training_info()
+            except ArithmeticError as exc:
+                errors.append(PackageError(
+                    index, package_type(package),
+                    [getattr(training, name)
+                     for name in training.__match_args__],
+                    str(exc)))
+                continue
+            for column, name in zip(columns, RESULT_COLUMNS):
+                column[index] = getattr(info, name)
+            code_column[index] = code_numbers[package_type(package)]
+            status[index] = 1
+    finally:
+        release_shared(shared, views, unlink=False)
+    return errors
+
+
+class SharedResults:
+    """Результаты в общей памяти; сообщения строятся по запросу.
+
+    Для сообщения нужны только колонки и номер кода тренировки, исходные
+    пакеты не хранятся. Общая память освобождается в close(), а если его
+    не вызвали - при сборке объекта или завершении интерпретатора.
+    """
+
+    def __init__(self, shared: SharedMemory, size: int,
+                 codes: tuple[str, ...],
+                 errors: list[PackageError]) -> None:
+        self.size = size
+        self.codes = codes
+        self.errors = errors
+        self.columns = column_views(shared.buf, size)
+        self._finalizer = weakref.finalize(
+            self, release_shared, shared, self.columns, True)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def is_valid(self, index: int) -> bool:
+        """Проверить, рассчитан ли пакет с таким номером."""
+        return bool(self.columns['status'][index])
+
+    def message(self, index: int) -> InfoMessage:
+        """Построить информационное сообщение для пакета."""
+        if not self.is_valid(index):
+            raise NameError('Ошибка полученных данных')
+        spec = WORKOUT_REGISTRY[self.codes[self.columns['code'][index]]]
+        return InfoMessage(spec.training_class.__name__,
+                           *(self.columns[name][index]
+                             for name in RESULT_COLUMNS))
+
+    def messages(self) -> Iterator[InfoMessage]:
+        """Лениво построить сообщения для корректных пакетов."""
+        for index in range(len(self)):
+            if self.is_valid(index):
+                yield self.message(index)
+
+    def close(self) -> None:
+        """Освободить представления и удалить общую память."""
+        self._finalizer()
+
+    def __enter__(self) -> 'SharedResults':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def process_packages_shared(source: Iterable[Package],
+                            workers: Optional[int] = None,
+                            chunk_size: int = 10_000) -> SharedResults:
+    """Рассчитать пакеты в пуле процессов с записью в общую память.
+
+    Номера пакетов в ошибках и колонках совпадают с позициями во входных
+    данных, как в process_packages_parallel. Буфер выделяется заранее,
+    поэтому источник без длины сначала читается в список; в обработке
+    одновременно не больше двух блоков на процесс.
+    """
+    workers = workers or os.cpu_count() or 1
+    packages = source if isinstance(source, Sized) else list(source)
+    size = len(packages)
+    codes = tuple(WORKOUT_REGISTRY)
+    shared = SharedMemory(create=True, size=max(size * ROW_SIZE, 1))
+    errors: list[PackageError] = []
+    pending: deque[Future] = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start, chunk in iter_chunks(packages, chunk_size):
+                pending.append(executor.submit(
+                    fill_shared_chunk, shared.name, size, start, chunk,
+                    codes))
+                if len(pending) >= 2 * workers:
+                    errors.extend(pending.popleft().result())
+            while pending:
+                errors.extend(pending.popleft().result())
+    except BaseException:
+        shared.close()
+        shared.unlink()
+        raise
+    return SharedResults(shared, size, codes, errors)
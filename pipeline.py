@@ -0,0 +1,85 @@
+"""Конвейер с отдельным потоком записи результатов."""
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from queue import Queue
+from typing import Iterable, Optional, TextIO, Union
+
+from homework import (InfoMessage, format_csv_header, stream_packages,
+                      write_messages)
+
+Package = Union[str, tuple[str, list[float]]]
+
+
+@dataclass(slots=True)
+class PipelineStats:
+    """Метрики работы конвейера."""
+    messages: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Сообщений в секунду."""
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Среднее время от расчёта блока до его записи, с."""
+        return self.total_latency / self.batches if self.batches else 0.0
+
+
+def write_worker(queue: Queue, stream: TextIO, message_format: str,
+                 stats: PipelineStats, failures: list[BaseException]) -> None:
+    """Забирать блоки из очереди и записывать их в поток."""
+    while (item := queue.get()) is not None:
+        if failures:
+            continue
+        queued_at, messages = item
+        try:
+            write_messages(messages, stream, message_format,
+                           chunk_size=len(messages), header=False)
+        except BaseException as exc:
+            failures.append(exc)
+            continue
+        latency = time.perf_counter() - queued_at
+        stats.messages += len(messages)
+        stats.batches += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+
+def run_pipeline(packages: Iterable[Package],
+                 stream: Optional[TextIO] = None,
+                 message_format: str = 'text',
+                 queue_size: int = 64,
+                 flush_size: int = 256) -> PipelineStats:
+    """Рассчитывать тренировки, пока отдельный поток пишет результаты."""
+    stream = sys.stdout if stream is None else stream
+    stats = PipelineStats()
+    failures: list[BaseException] = []
+    queue: Queue[Optional[tuple[float, list[InfoMessage]]]] = Queue(
+        maxsize=queue_size)
+    writer = threading.Thread(
+        target=write_worker,
+        args=(queue, stream, message_format, stats, failures),
+        name='pipeline-writer', daemon=True)
+    start = time.perf_counter()
+    if message_format == 'csv':
+        stream.write(format_csv_header() + '\n')
+    writer.start()
+    infos = stream_packages(packages)
+    try:
+        while not failures and (chunk := list(islice(infos, flush_size))):
+            queue.put((time.perf_counter(), chunk))
+    finally:
+        queue.put(None)
+        writer.join()
+    stats.elapsed = time.perf_counter() - start
+    if failures:
+        raise failures[0]
+    return stats
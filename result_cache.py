@@ -0,0 +1,61 @@
+"""Кеш результатов для повторно присланных пакетов."""
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import homework
+from homework import InfoMessage
+
+PackageKey = tuple[str, tuple[float, ...]]
+CachedInfo = tuple[str, float, float, float, float]
+
+
+class PackageCache:
+    """LRU-кеш результатов тренировок с ограничением размера и TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[PackageKey,
+                                 tuple[float, CachedInfo]] = OrderedDict()
+
+    def get_info(self, workout_type: str, data: list[float]) -> InfoMessage:
+        """Вернуть результат пакета из кеша или рассчитать его.
+
+        Кеш хранит неизменяемый кортеж, и каждый вызов получает своё
+        сообщение, поэтому изменения у одного вызывающего не видны другим.
+        """
+        key = (workout_type, tuple(data))
+        now = self.clock()
+        item = self._items.get(key)
+        if item is not None and (self.ttl is None
+                                 or now - item[0] < self.ttl):
+            self._items.move_to_end(key)
+            self.hits += 1
+            return InfoMessage(*item[1])
+        self.misses += 1
+        info = homework.read_package(workout_type,
+                                     data).show_training_info()
+        self._items[key] = (now, (info.training_type, info.duration,
+                                  info.distance, info.speed, info.calories))
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return info
+
+    def clear(self) -> None:
+        """Очистить кеш и счётчики."""
+        self._items.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Вернуть счётчики попаданий и промахов."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._items), 'maxsize': self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,48 @@
+"""Расчёт показателей по временным рядам с разбиением на отрезки."""
+from itertools import accumulate
+from typing import Sequence
+
+from homework import WORKOUT_REGISTRY, compute_batch
+
+SECONDS_IN_HOUR = 3600
+
+
+def compute_segments(workout_type: str,
+                     series: dict[str, Sequence[float]],
+                     constants: dict[str, float],
+                     interval: float = 1.0,
+                     samples_per_segment: int = 60
+                     ) -> dict[str, dict[str, list[float]]]:
+    """Рассчитать показатели по отрезкам и нарастающим итогом.
+
+    series - поля, которые суммируются по отсчётам (шаги `action`,
+    бассейны `count_pool`), constants - неизменные поля (вес, рост,
+    длина бассейна), interval - период отсчётов в секундах.
+    """
+    spec = WORKOUT_REGISTRY[workout_type]
+    missing = set(spec.fields) - set(series) - set(constants) - {'duration'}
+    if missing:
+        raise ValueError(f'Не заданы поля: {", ".join(sorted(missing))}')
+    lengths = {len(values) for values in series.values()}
+    if len(lengths) != 1:
+        raise ValueError('Ряды должны быть одинаковой длины')
+    size = lengths.pop()
+    ends = list(range(samples_per_segment, size, samples_per_segment))
+    if size:
+        ends.append(size)
+    starts = [0] + ends[:-1]
+    totals = {name: [0, *accumulate(values)]
+              for name, values in series.items()}
+    segments: dict[str, list[float]] = {
+        'duration': [(end - start) * interval / SECONDS_IN_HOUR
+                     for start, end in zip(starts, ends)]}
+    cumulative: dict[str, list[float]] = {
+        'duration': [end * interval / SECONDS_IN_HOUR for end in ends]}
+    for name, running in totals.items():
+        segments[name] = [running[end] - running[start]
+                          for start, end in zip(starts, ends)]
+        cumulative[name] = [running[end] for end in ends]
+    for name, value in constants.items():
+        segments[name] = cumulative[name] = [value] * len(ends)
+    return {'segments': compute_batch(workout_type, segments),
+            'cumulative': compute_batch(workout_type, cumulative)}
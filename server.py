@@ -0,0 +1,147 @@
+"""Асинхронный сервер приёма пакетов от датчиков."""
+import argparse
+import asyncio
+import errno
+import json
+import os
+import socket
+import stat
+from dataclasses import asdict
+from typing import Optional
+
+import homework
+
+DEFAULT_MAX_CLIENTS = 100
+BUSY_MESSAGE = 'Сервер занят, повторите подключение позже'
+TOO_LONG_MESSAGE = 'Слишком длинная строка пакета'
+
+
+def format_error(reason: object, response_format: str = 'text') -> str:
+    """Вернуть строку ответа с ошибкой."""
+    if response_format == 'json':
+        return json.dumps({'error': str(reason)}, ensure_ascii=False)
+    return f'Ошибка: {reason}'
+
+
+def handle_line(line: str, response_format: str = 'text') -> str:
+    """Обработать одну строку пакета и вернуть строку ответа.
+
+    Пакет проверяется так же, как в командной строке и параллельном
+    обработчике, поэтому в ответ приходит причина ошибки.
+    """
+    try:
+        package = (json.loads(line) if line.lstrip().startswith('[')
+                   else line)
+        training = homework.load_package(0, package)
+        if training is None:
+            return format_error('Пустой пакет', response_format)
+        if isinstance(training, homework.PackageError):
+            return format_error(training.reason, response_format)
+        info = training.show_training_info()
+    except (ValueError, TypeError, ArithmeticError, RecursionError) as exc:
+        return format_error(exc, response_format)
+    if response_format == 'json':
+        return json.dumps(asdict(info), ensure_ascii=False)
+    return info.get_message()
+
+
+async def handle_client(reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter,
+                        limiter: asyncio.Semaphore,
+                        response_format: str) -> None:
+    """Обслужить одного клиента: пакет на строку, ответ на строку.
+
+    Сверх лимита клиентов соединение сразу закрывается с ответом об
+    ошибке. Строка длиннее буфера чтения тоже получает ошибку, после
+    чего соединение закрывается: границу следующего пакета уже не найти.
+    """
+    try:
+        if limiter.locked():
+            writer.write(format_error(BUSY_MESSAGE, response_format).encode()
+                         + b'\n')
+            await writer.drain()
+            return
+        async with limiter:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(format_error(TOO_LONG_MESSAGE,
+                                              response_format).encode()
+                                 + b'\n')
+                    await writer.drain()
+                    return
+                if not line:
+                    return
+                if not line.strip():
+                    continue
+                response = handle_line(line.decode(errors='replace'),
+                                       response_format)
+                writer.write(response.encode() + b'\n')
+                await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def remove_stale_socket(path: str) -> None:
+    """Удалить сокет прошлого запуска, если его больше никто не слушает.
+
+    Файл другого типа или сокет, к которому можно подключиться, не
+    трогается: тогда запуск завершается ошибкой.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, 'Путь занят не сокетом', path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    raise OSError(errno.EADDRINUSE, 'Сокет уже используется сервером', path)
+
+
+async def start_server(host: str = '127.0.0.1', port: int = 8765,
+                       path: Optional[str] = None,
+                       max_clients: int = DEFAULT_MAX_CLIENTS,
+                       response_format: str = 'text') -> asyncio.Server:
+    """Запустить TCP или Unix-сокет сервер приёма пакетов."""
+    limiter = asyncio.Semaphore(max_clients)
+
+    async def client_connected(reader, writer):
+        await handle_client(reader, writer, limiter, response_format)
+
+    if path is not None:
+        remove_stale_socket(path)
+        return await asyncio.start_unix_server(client_connected, path=path)
+    return await asyncio.start_server(client_connected, host, port)
+
+
+async def main() -> None:
+    """Главная функция."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', dest='path',
+                        help='путь Unix-сокета для режима демона')
+    parser.add_argument('--max-clients', type=int,
+                        default=DEFAULT_MAX_CLIENTS)
+    parser.add_argument('--format', dest='response_format',
+                        choices=('text', 'json'), default='text')
+    args = parser.parse_args()
+    server = await start_server(**vars(args))
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""Приближённые квантили показателей тренировок в потоке результатов.
+
+Логарифмическая гистограмма гарантирует относительную ошибку квантиля
+не больше relative_accuracy, занимает ограниченную память и складывается
+с гистограммами других процессов.
+"""
+import math
+from typing import Iterable
+
+from homework import InfoMessage
+
+METRICS: tuple[str, ...] = ('speed', 'calories')
+
+
+class LogHistogram:
+    """Гистограмма с корзинами геометрически растущей ширины."""
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 max_buckets: int = 2048) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Учесть значение; неположительные значения идут в нулевую корзину."""
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self.collapse()
+
+    def collapse(self) -> None:
+        """Слить младшие корзины, чтобы уложиться в max_buckets."""
+        keys = sorted(self.buckets)
+        extra = len(keys) - self.max_buckets
+        merged = sum(self.buckets.pop(key) for key in keys[:extra])
+        first = keys[extra]
+        self.buckets[first] += merged
+
+    def merge(self, other: 'LogHistogram') -> None:
+        """Добавить гистограмму с той же точностью."""
+        if other.gamma != self.gamma:
+            raise ValueError('Точность гистограмм должна совпадать')
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.buckets) > self.max_buckets:
+            self.collapse()
+
+    def quantile(self, q: float) -> float:
+        """Вернуть приближённое значение квантиля q из [0, 1]."""
+        if not self.count:
+            raise ValueError('Гистограмма пуста')
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class MetricSketches:
+    """Гистограммы скорости и калорий по видам тренировок."""
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 max_buckets: int = 2048) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.histograms: dict[tuple[str, str], LogHistogram] = {}
+
+    def histogram(self, training_type: str, metric: str) -> LogHistogram:
+        """Вернуть гистограмму показателя, создав её при необходимости."""
+        key = (training_type, metric)
+        if key not in self.histograms:
+            self.histograms[key] = LogHistogram(self.relative_accuracy,
+                                                self.max_buckets)
+        return self.histograms[key]
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть результат тренировки."""
+        for metric in METRICS:
+            self.histogram(info.training_type, metric).add(
+                getattr(info, metric))
+
+    def extend(self, messages: Iterable[InfoMessage]) -> None:
+        """Учесть поток результатов."""
+        for info in messages:
+            self.add(info)
+
+    def merge(self, other: 'MetricSketches') -> None:
+        """Добавить гистограммы другого процесса."""
+        for (training_type, metric), histogram in other.histograms.items():
+            self.histogram(training_type, metric).merge(histogram)
+
+    def quantiles(self, training_type: str, metric: str,
+                  qs: Iterable[float] = (0.5, 0.95, 0.99)
+                  ) -> dict[float, float]:
+        """Вернуть квантили показателя по виду тренировки."""
+        histogram = self.histograms[(training_type, metric)]
+        return {q: histogram.quantile(q) for q in qs}
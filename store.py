@@ -0,0 +1,101 @@
+"""Хранение результатов тренировок в SQLite с индексами для отчётов."""
+import sqlite3
+from typing import Iterable, Optional
+
+from homework import InfoMessage
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    athlete TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    training_type TEXT NOT NULL,
+    duration REAL NOT NULL,
+    distance REAL NOT NULL,
+    speed REAL NOT NULL,
+    calories REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_type_time
+    ON results (training_type, timestamp);
+CREATE INDEX IF NOT EXISTS results_time ON results (timestamp);
+CREATE INDEX IF NOT EXISTS results_athlete_time
+    ON results (athlete, timestamp);
+'''
+METRICS: frozenset[str] = frozenset({'duration', 'distance', 'speed',
+                                     'calories'})
+AGGREGATES: frozenset[str] = frozenset({'SUM', 'AVG', 'MAX', 'MIN', 'COUNT'})
+
+Record = tuple[str, float, InfoMessage]
+
+
+class ResultStore:
+    """Хранилище результатов тренировок по спортсменам и времени."""
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def add_many(self, records: Iterable[Record]) -> int:
+        """Сохранить результаты одной транзакцией, вернуть их число."""
+        with self.connection:
+            cursor = self.connection.executemany(
+                'INSERT INTO results (athlete, timestamp, training_type, '
+                'duration, distance, speed, calories) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                ((athlete, timestamp, info.training_type, info.duration,
+                  info.distance, info.speed, info.calories)
+                 for athlete, timestamp, info in records))
+        return cursor.rowcount
+
+    @staticmethod
+    def _where(training_type: Optional[str], athlete: Optional[str],
+               start: Optional[float],
+               end: Optional[float]) -> tuple[str, list]:
+        conditions = []
+        params: list = []
+        for condition, value in (('training_type = ?', training_type),
+                                 ('athlete = ?', athlete),
+                                 ('timestamp >= ?', start),
+                                 ('timestamp < ?', end)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        return where, params
+
+    def aggregate(self, metric: str = 'calories', function: str = 'SUM',
+                  training_type: Optional[str] = None,
+                  athlete: Optional[str] = None,
+                  start: Optional[float] = None,
+                  end: Optional[float] = None) -> float:
+        """Посчитать агрегат показателя за интервал [start, end)."""
+        if metric not in METRICS or function not in AGGREGATES:
+            raise ValueError('Неизвестный показатель или функция')
+        where, params = self._where(training_type, athlete, start, end)
+        (value,) = self.connection.execute(
+            f'SELECT {function}({metric}) FROM results{where}',
+            params).fetchone()
+        return value or 0.0
+
+    def query(self, training_type: Optional[str] = None,
+              athlete: Optional[str] = None,
+              start: Optional[float] = None,
+              end: Optional[float] = None) -> list[Record]:
+        """Вернуть сохранённые результаты в порядке времени."""
+        where, params = self._where(training_type, athlete, start, end)
+        rows = self.connection.execute(
+            'SELECT athlete, timestamp, training_type, duration, distance, '
+            f'speed, calories FROM results{where} ORDER BY timestamp, id',
+            params)
+        return [(athlete, timestamp, InfoMessage(*values))
+                for athlete, timestamp, *values in rows]
+
+    def close(self) -> None:
+        """Закрыть соединение с базой."""
+        self.connection.close()
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,41 @@
+import pytest
+
+import aggregation
+import homework
+
+WEEK = 7 * 24 * 3600
+
+
+def test_rolling_aggregator():
+    aggregator = aggregation.RollingAggregator(WEEK)
+    packages = [
+        (0, 'anna', ('RUN', [15000, 1, 75])),
+        (3600, 'anna', ('RUN', [9000, 1, 75])),
+        (3600, 'ivan', ('RUN', [1206, 12, 6])),
+        (WEEK + 1800, 'anna', ('WLK', [9000, 1, 75, 180])),
+        (WEEK + 1800, 'anna', ('RUN', [1206, 12, 6])),
+    ]
+    infos = []
+    for timestamp, athlete, package in packages:
+        info = homework.read_package(*package).show_training_info()
+        infos.append(info)
+        aggregator.add(athlete, info, timestamp)
+    totals = aggregator.totals('anna', 'Running')
+    assert totals.count == 2
+    assert totals.distance == pytest.approx(5.85 + 0.7839)
+    assert totals.calories == pytest.approx(
+        infos[1].calories + infos[4].calories)
+    assert totals.max_speed == pytest.approx(5.85)
+    assert totals.mean_speed == pytest.approx(
+        (infos[1].speed + infos[4].speed) / 2)
+    assert aggregator.totals('anna', 'SportsWalking').count == 1
+    assert aggregator.totals('ivan', 'Running', now=WEEK + 3600).count == 0
+    assert aggregator.totals('petr', 'Running').count == 0
+
+
+def test_rolling_window_order():
+    rolling = aggregation.RollingWindow(10)
+    info = homework.InfoMessage('Running', 1, 1, 1, 1)
+    rolling.add(5, info)
+    with pytest.raises(ValueError):
+        rolling.add(4, info)
@@ -0,0 +1,66 @@
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ('RUN', [420, 4, 20]),
+]
+
+
+def test_group_packages():
+    batches = batch.group_packages(PACKAGES)
+    assert {key: len(value) for key, value in batches.items()} == {
+        'SWM': 1, 'RUN': 3, 'WLK': 2}
+    for workout_type, training_batch in batches.items():
+        expected = [homework.read_package(*package).show_training_info()
+                    for package in PACKAGES if package[0] == workout_type]
+        assert list(training_batch.messages()) == expected
+        assert [training.show_training_info()
+                for training in training_batch] == expected
+
+
+def test_training_batch_slicing():
+    running = batch.group_packages(PACKAGES)['RUN']
+    assert isinstance(running[0], homework.Running)
+    assert running[1] == homework.Running(1206, 12, 6)
+    assert [training.action for training in running[1:]] == [1206, 420]
+    shorter = running.filter(speed > 1 for speed in
+                             running.show_training_info()['speed'])
+    assert list(shorter) == [homework.Running(15000, 1, 75)]
+
+
+def test_training_batch_errors():
+    with pytest.raises(NameError):
+        batch.TrainingBatch('XXX')
+    with pytest.raises(NameError):
+        batch.TrainingBatch('RUN').append([1, 2])
+
+
+@pytest.mark.parametrize('data', [
+    [15000, None, 75],
+    [15000, 1, 'heavy'],
+    [15000, 0, 75],
+    [15000, 1, float('nan')],
+])
+def test_training_batch_rejects_row_atomically(data):
+    running = batch.TrainingBatch('RUN')
+    running.append([15000, 1, 75])
+    with pytest.raises(NameError):
+        running.append(data)
+    assert [len(column) for column in running.columns.values()] == [1] * 3, (
+        'Некорректный пакет не должен попадать ни в одну колонку.'
+    )
+    assert list(running) == [homework.Running(15000, 1, 75)]
+
+
+@pytest.mark.parametrize('mask', [[True], [True] * 4])
+def test_training_batch_filter_mask_length(mask):
+    running = batch.group_packages(PACKAGES)['RUN']
+    with pytest.raises(ValueError):
+        running.filter(mask)
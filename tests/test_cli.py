@@ -0,0 +1,61 @@
+from io import StringIO
+
+import pytest
+
+import cli
+
+
+def test_cli_files(tmp_path):
+    path = tmp_path / 'packages.txt'
+    path.write_text('SWM 720 1 80 25 40\n\nRUN 1206 12 6\n', encoding='utf-8')
+    stream = StringIO()
+    assert cli.main(['--format', 'csv', str(path)], stream) == 0
+    assert stream.getvalue().splitlines() == [
+        'training_type,duration,distance,speed,calories',
+        'Swimming,1,0.9935999999999999,1.0,336.0',
+        'Running,12,0.7838999999999999,0.065325,12.812472',
+    ]
+
+
+def test_cli_stdin(monkeypatch):
+    monkeypatch.setattr('sys.stdin', StringIO('WLK 9000 1 75 180\n'))
+    stream = StringIO()
+    cli.main([], stream)
+    assert stream.getvalue() == (
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 349.252.\n'
+    )
+
+
+def test_cli_bad_format():
+    with pytest.raises(SystemExit):
+        cli.main(['--format', 'xml'])
+
+
+def test_cli_bad_lines(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', StringIO(
+        'RUN 15000 1 75\nRUN fast 1 75\n\nWLK 9000 1\nRUN 1206 12 6\n'))
+    assert cli.main(['--format', 'csv']) == 1, (
+        'Некорректные строки должны давать код возврата 1.'
+    )
+    output = capsys.readouterr()
+    assert output.out.splitlines()[1:] == [
+        'Running,1,9.75,9.75,797.805',
+        'Running,12,0.7838999999999999,0.065325,12.812472',
+    ]
+    assert [line.split(':')[0] for line in output.err.splitlines()] == [
+        '1', '3']
+
+
+def test_cli_arithmetic_error(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', StringIO(
+        'WLK 1e203 1 75 180\nRUN 15000 1 75\n'))
+    assert cli.main(['--format', 'csv']) == 1
+    output = capsys.readouterr()
+    assert output.out.splitlines()[1:] == ['Running,1,9.75,9.75,797.805'], (
+        'Ошибка расчёта одной строки не должна прерывать обработку.'
+    )
+    assert output.err.startswith('0: ')
@@ -0,0 +1,84 @@
+import mmap
+
+import pytest
+
+import columnar
+import homework
+
+
+@pytest.mark.parametrize('workout_type, packages', [
+    ('SWM', [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4]]),
+    ('RUN', [[15000, 1, 75], [1206, 12, 6]]),
+    ('WLK', [[9000, 1, 75, 180], [3000.33, 2.512, 75.8, 180.1]]),
+])
+def test_column_file(tmp_path, workout_type, packages):
+    fields = homework.WORKOUT_REGISTRY[workout_type].fields
+    columns = {field: [data[i] for data in packages]
+               for i, field in enumerate(fields)}
+    path = tmp_path / 'packages.bin'
+    assert columnar.write_columns(path, workout_type, columns) == 2
+    with columnar.ColumnFile(path) as column_file:
+        assert column_file.workout_type == workout_type
+        assert isinstance(column_file.columns['weight'], memoryview)
+        assert column_file.columns['weight'].tolist() == columns['weight']
+        result = column_file.compute()
+    assert result == homework.compute_batch(workout_type, columns)
+
+
+def test_column_file_bad_size(tmp_path):
+    path = tmp_path / 'packages.bin'
+    columnar.write_columns(path, 'RUN', {'action': [1], 'duration': [1],
+                                         'weight': [1]})
+    with open(path, 'ab') as file:
+        file.write(b'\0')
+    with pytest.raises(ValueError):
+        columnar.ColumnFile(path)
+
+
+@pytest.mark.parametrize('workout_type', ['RN', 'ROWX', 'ÜBR'])
+def test_write_columns_rejects_bad_codes(tmp_path, monkeypatch,
+                                         workout_type):
+    monkeypatch.setitem(homework.WORKOUT_REGISTRY, workout_type,
+                        homework.WORKOUT_REGISTRY['RUN'])
+    path = tmp_path / 'packages.bin'
+    with pytest.raises(ValueError):
+        columnar.write_columns(path, workout_type,
+                               {'action': [1], 'duration': [1],
+                                'weight': [1]})
+    assert not path.exists(), 'Файл с неверным кодом не должен создаваться.'
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'TRNC',
+    b'TRNCRUN\x03',
+    b'XXXXRUN\x03' + bytes(8),
+    b'TRNC\xff\xff\xff\x03' + bytes(8),
+])
+def test_column_file_bad_header(tmp_path, monkeypatch, content):
+    mappings = []
+    original = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        mappings.append(original(*args, **kwargs))
+        return mappings[-1]
+
+    monkeypatch.setattr(columnar.mmap, 'mmap', recording_mmap)
+    path = tmp_path / 'packages.bin'
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        columnar.ColumnFile(path)
+    assert all(mapping.closed for mapping in mappings), (
+        'Отображение файла должно закрываться при ошибке заголовка.'
+    )
+
+
+def test_write_columns_length_mismatch(tmp_path):
+    path = tmp_path / 'packages.bin'
+    with pytest.raises(ValueError):
+        columnar.write_columns(path, 'RUN', {'action': [1, 2],
+                                             'duration': [1],
+                                             'weight': [1, 2]})
+    assert not path.exists(), (
+        'При несовпадении длин колонок файл не должен создаваться.'
+    )
@@ -0,0 +1,268 @@
+import math
+import os
+import random
+import timeit
+
+import pytest
+
+import batch
+import columnar
+import homework
+import parallel
+import result_cache
+
+SEEDS = range(5)
+SAMPLES = 200
+REL_TOL = 1e-12
+BATCH_MIN_RATIO = 2
+KERNEL_MIN_RATIO = 0.8
+OBJECT_MIN_RATIO = 0.5
+
+# Отношения скоростей около 1.0 зависят от загрузки машины, поэтому такие
+# замеры запускаются только по HOMEWORK_THROUGHPUT_TESTS=1.
+micro_timing = pytest.mark.skipif(
+    not os.environ.get('HOMEWORK_THROUGHPUT_TESTS'),
+    reason='замеры с малым запасом включаются HOMEWORK_THROUGHPUT_TESTS=1')
+
+
+def attribute_calories(workout_type):
+    """Исходная формула калорий с поиском констант в атрибутах класса."""
+    cls = homework.WORKOUT_REGISTRY[workout_type].training_class
+    if workout_type == 'SWM':
+        return lambda speed, weight, duration: (
+            (speed + cls.K3) * cls.K4 * weight * duration)
+    if workout_type == 'WLK':
+        return lambda speed, weight, duration, height: (
+            (cls.K1 * weight + ((speed * cls.K_KMH_TO_MS)**2
+             / (height / cls.CM_IN_M)) * cls.K2 * weight)
+            * duration * cls.MIN_IN_HOUR)
+    return lambda speed, weight, duration: (
+        (cls.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+         + cls.CALORIES_MEAN_SPEED_SHIFT)
+        * weight / cls.M_IN_KM * duration * cls.MIN_IN_HOUR)
+
+
+class LegacyRunning(homework.Running):
+    """Бег с расчётом калорий по исходной формуле через атрибуты."""
+
+    def get_spent_calories(self):
+        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER
+                 * self.get_mean_speed()
+                 + self.CALORIES_MEAN_SPEED_SHIFT)
+                * self.weight / self.M_IN_KM
+                * self.duration * self.MIN_IN_HOUR)
+
+
+class LegacySportsWalking(homework.SportsWalking):
+    """Ходьба с расчётом калорий по исходной формуле через атрибуты."""
+
+    def get_spent_calories(self):
+        return ((self.K1 * self.weight + ((self.get_mean_speed()
+                * self.K_KMH_TO_MS)**2 / (self.height / self.CM_IN_M))
+                * self.K2 * self.weight) * self.duration * self.MIN_IN_HOUR)
+
+
+class LegacySwimming(homework.Swimming):
+    """Плавание с расчётом калорий по исходной формуле через атрибуты."""
+
+    def get_spent_calories(self):
+        return ((self.get_mean_speed() + self.K3) * self.K4
+                * self.weight * self.duration)
+
+
+# Объектный путь до появления пакетных и кешированных расчётов.
+LEGACY_CLASSES = {
+    'SWM': LegacySwimming,
+    'RUN': LegacyRunning,
+    'WLK': LegacySportsWalking,
+}
+
+
+def calories_args(workout_type, data, speed):
+    """Аргументы функции калорий: скорость, вес, время и рост."""
+    action, duration, weight, *extra = data
+    if workout_type == 'WLK':
+        return (speed, weight, duration, *extra)
+    return (speed, weight, duration)
+
+
+def reference_info(workout_type, data):
+    """Эталонный расчёт показателей по исходным формулам."""
+    cls = homework.WORKOUT_REGISTRY[workout_type].training_class
+    action, duration, weight, *extra = data
+    distance = action * cls.LEN_STEP / cls.M_IN_KM
+    if workout_type == 'SWM':
+        length_pool, count_pool = extra
+        speed = length_pool * count_pool / cls.M_IN_KM / duration
+    else:
+        speed = distance / duration
+    calories = attribute_calories(workout_type)(
+        *calories_args(workout_type, data, speed))
+    return (duration, distance, speed, calories)
+
+
+def random_package(rng, workout_type):
+    data = [rng.choice([rng.randint(1, 40000), rng.uniform(1, 40000)]),
+            rng.uniform(0.05, 6), rng.uniform(20, 200)]
+    if workout_type == 'WLK':
+        data.append(rng.uniform(100, 230))
+    elif workout_type == 'SWM':
+        data += [rng.randint(10, 50), rng.randint(1, 200)]
+    return data
+
+
+def random_packages(seed, workout_type):
+    rng = random.Random(seed)
+    return [random_package(rng, workout_type) for _ in range(SAMPLES)]
+
+
+def to_columns(workout_type, packages):
+    fields = homework.WORKOUT_REGISTRY[workout_type].fields
+    return {field: [data[i] for data in packages]
+            for i, field in enumerate(fields)}
+
+
+def assert_close(result, expected):
+    assert len(result) == len(expected)
+    for got, want in zip(result, expected):
+        assert all(math.isclose(a, b, rel_tol=REL_TOL)
+                   for a, b in zip(got, want)), (
+            'Быстрый путь расходится с эталонным расчётом: '
+            f'{got} != {want}'
+        )
+
+
+def as_tuples(messages):
+    return [(info.duration, info.distance, info.speed, info.calories)
+            for info in messages]
+
+
+def batch_rows(result):
+    return list(zip(result['duration'], result['distance'],
+                    result['speed'], result['calories']))
+
+
+def object_path(workout_type, packages, slotted=False):
+    return as_tuples(
+        homework.read_package(workout_type, data, slotted=slotted)
+        .show_training_info() for data in packages)
+
+
+def compute_batch_path(workout_type, packages):
+    return batch_rows(homework.compute_batch(
+        workout_type, to_columns(workout_type, packages)))
+
+
+def training_batch_path(workout_type, packages):
+    training_batch = batch.TrainingBatch(workout_type)
+    training_batch.extend(packages)
+    return as_tuples(training_batch.messages())
+
+
+def cache_path(workout_type, packages):
+    cache = result_cache.PackageCache()
+    return as_tuples(cache.get_info(workout_type, data)
+                     for data in packages + packages)[len(packages):]
+
+
+def chunk_path(workout_type, packages):
+    messages, _ = parallel.process_chunk(
+        0, [(workout_type, data) for data in packages])
+    return as_tuples(messages)
+
+
+def shared_path(workout_type, packages):
+    with parallel.process_packages_shared(
+            [(workout_type, data) for data in packages],
+            workers=2, chunk_size=64) as results:
+        return as_tuples(results.messages())
+
+
+FAST_PATHS = {
+    'objects': object_path,
+    'slotted': lambda workout_type, packages: object_path(
+        workout_type, packages, slotted=True),
+    'compute_batch': compute_batch_path,
+    'TrainingBatch': training_batch_path,
+    'PackageCache': cache_path,
+    'process_chunk': chunk_path,
+    'shared_memory': shared_path,
+}
+
+
+@pytest.mark.parametrize('path', FAST_PATHS)
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_fast_path_equivalence(seed, workout_type, path):
+    packages = random_packages(seed, workout_type)
+    expected = [reference_info(workout_type, data) for data in packages]
+    assert_close(FAST_PATHS[path](workout_type, packages), expected)
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_columnar_equivalence(tmp_path, workout_type):
+    packages = random_packages(0, workout_type)
+    path = tmp_path / 'packages.bin'
+    columnar.write_columns(path, workout_type,
+                           to_columns(workout_type, packages))
+    with columnar.ColumnFile(path) as column_file:
+        result = batch_rows(column_file.compute())
+    assert_close(result, [reference_info(workout_type, data)
+                          for data in packages])
+
+
+def best_time(func, number=5, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_compute_batch_throughput(workout_type):
+    packages = random_packages(0, workout_type) * 10
+    columns = to_columns(workout_type, packages)
+    objects = best_time(lambda: object_path(workout_type, packages))
+    batched = best_time(lambda: homework.compute_batch(workout_type,
+                                                       columns))
+    assert objects / batched >= BATCH_MIN_RATIO, (
+        '`compute_batch` должен быть заметно быстрее расчёта по объектам.'
+    )
+
+
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_object_path_throughput(workout_type):
+    packages = random_packages(0, workout_type)
+    trainings = [homework.read_package(workout_type, data)
+                 for data in packages]
+    legacy = [LEGACY_CLASSES[workout_type](*data) for data in packages]
+    assert_close(as_tuples(training.show_training_info()
+                           for training in legacy),
+                 as_tuples(training.show_training_info()
+                           for training in trainings))
+    current_time = best_time(
+        lambda: [training.show_training_info() for training in trainings],
+        number=20)
+    legacy_time = best_time(
+        lambda: [training.show_training_info() for training in legacy],
+        number=20)
+    assert legacy_time / current_time >= OBJECT_MIN_RATIO, (
+        '`show_training_info` не должен заметно отставать от исходного '
+        'объектного расчёта.'
+    )
+
+
+@micro_timing
+@pytest.mark.parametrize('workout_type', ['SWM', 'RUN', 'WLK'])
+def test_calories_kernel_throughput(workout_type):
+    packages = random_packages(0, workout_type)
+    args = [calories_args(workout_type, data,
+                          reference_info(workout_type, data)[2])
+            for data in packages]
+    kernel = homework.WORKOUT_REGISTRY[
+        workout_type].training_class.calories_kernel
+    reference = attribute_calories(workout_type)
+    kernel_time = best_time(lambda: [kernel(*row) for row in args],
+                            number=50, repeat=7)
+    reference_time = best_time(lambda: [reference(*row) for row in args],
+                               number=50, repeat=7)
+    assert reference_time / kernel_time >= KERNEL_MIN_RATIO, (
+        'Функция калорий не должна быть медленнее расчёта через атрибуты.'
+    )
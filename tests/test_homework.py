@@ -1,7 +1,11 @@
 import re
+import pickle
 import pytest
+import sys
 import types
 import inspect
+from io import StringIO
+from dataclasses import dataclass
 from collections import namedtuple
 from conftest import Capturing
 
@@ -451,3 +455,286 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('workout_type, packages', [
+    ('SWM', [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4],
+             [1206, 12, 6, 12, 6]]),
+    ('RUN', [[9000, 1, 75], [420, 4, 20], [1206, 12, 6]]),
+    ('WLK', [[9000, 1, 75, 180], [420, 4, 20, 42],
+             [3000.33, 2.512, 75.8, 180.1]]),
+])
+def test_compute_batch(workout_type, packages):
+    assert hasattr(homework, 'compute_batch'), (
+        'Создайте функцию `compute_batch` для расчёта по колонкам.'
+    )
+    fields = homework.WORKOUT_REGISTRY[workout_type].fields
+    columns = {field: [data[i] for data in packages]
+               for i, field in enumerate(fields)}
+    result = homework.compute_batch(workout_type, columns)
+    for i, data in enumerate(packages):
+        info = homework.read_package(workout_type, data).show_training_info()
+        for field in ['duration', 'distance', 'speed', 'calories']:
+            assert result[field][i] == getattr(info, field), (
+                'Функция `compute_batch` должна возвращать те же значения, '
+                'что и расчёт по объектам.'
+            )
+
+
+def test_stream_packages():
+    assert hasattr(homework, 'stream_packages'), (
+        'Создайте генератор `stream_packages`.'
+    )
+    source = StringIO('SWM 720 1 80 25 40\n\nWLK 9000 1.5 75 180\n')
+    result = homework.stream_packages(source)
+    assert isinstance(result, types.GeneratorType), (
+        '`stream_packages` должна быть генератором.'
+    )
+    assert [info.get_message() for info in result] == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.500 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 3.900 км/ч; '
+        'Потрачено ккал: 364.084.',
+    ]
+    packages = iter([('RUN', [1206, 12, 6]), ('RUN', [1, 2])])
+    stream = homework.stream_packages(packages)
+    assert next(stream).calories == pytest.approx(12.812, abs=1e-3)
+    with pytest.raises(NameError):
+        next(stream)
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_read_package_slotted(input_data):
+    training = homework.read_package(*input_data)
+    slotted = homework.read_package(*input_data, slotted=True)
+    assert not hasattr(slotted, '__dict__'), (
+        'Слотовый вариант тренировки не должен иметь `__dict__`.'
+    )
+    assert isinstance(slotted, homework.make_slotted(homework.Training))
+    assert slotted.__class__.__name__ == training.__class__.__name__
+    assert slotted.show_training_info() == training.show_training_info(), (
+        'Слотовый вариант должен давать тот же результат.'
+    )
+    assert isinstance(slotted, homework.Training)
+    assert isinstance(slotted, type(training)), (
+        'Слотовый вариант должен проходить проверку isinstance исходного '
+        'класса.'
+    )
+    restored = pickle.loads(pickle.dumps(slotted))
+    assert type(restored) is type(slotted)
+    assert restored == slotted, (
+        'Слотовый вариант должен сохраняться через pickle.'
+    )
+    assert pickle.loads(pickle.dumps(type(slotted))) is type(slotted)
+
+
+def test_make_slotted_plugin_pickle(monkeypatch):
+    module = types.ModuleType('plugin_workouts')
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    @dataclass
+    class Rowing(homework.Training):
+        strokes: int
+
+        def get_spent_calories(self) -> float:
+            return self.weight * self.duration
+
+    Rowing.__module__, Rowing.__qualname__ = module.__name__, 'Rowing'
+    module.Rowing = Rowing
+    slotted_class = homework.make_slotted(Rowing)
+    training = slotted_class(1000, 1, 80, 30)
+    assert repr(training) == (
+        'SlottedRowing(action=1000, duration=1, weight=80, strokes=30)')
+    assert training.show_training_info().training_type == 'Rowing'
+    assert pickle.loads(pickle.dumps(slotted_class)) is slotted_class
+    assert pickle.loads(pickle.dumps(training)) == training
+
+
+def test_register_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_REGISTRY',
+                        dict(homework.WORKOUT_REGISTRY))
+
+    @dataclass
+    class Rowing(homework.Training):
+        strokes_per_minute: int
+
+        def get_spent_calories(self) -> float:
+            return self.weight * self.duration
+
+    homework.register_workout('ROW', Rowing)
+    spec = homework.WORKOUT_REGISTRY['ROW']
+    assert spec.arity == 4
+    assert spec.fields == ('action', 'duration', 'weight',
+                           'strokes_per_minute')
+    assert homework.check_correct_data('ROW', [1000, 1, 80, 30])
+    assert not homework.check_correct_data('ROW', [1000, 1, 80])
+    assert not homework.check_correct_data('ROW', [None] * 4)
+    training = homework.read_package('ROW', [1000, 1, 80, 30])
+    assert isinstance(training, Rowing)
+
+
+@pytest.mark.parametrize('slotted', [False, True])
+def test_subclass_calories_override(slotted):
+    @dataclass
+    class Trail(homework.Running):
+        def get_spent_calories(self) -> float:
+            return 42.0
+
+    @dataclass
+    class Hills(homework.Running):
+        def get_spent_calories(self) -> float:
+            return self.get_spent_calories_for(self.get_mean_speed())
+
+        def get_spent_calories_for(self, speed: float) -> float:
+            return speed * 2
+
+    trail = Trail(15000, 1, 75)
+    hills = Hills(15000, 1, 75)
+    if slotted:
+        trail = homework.make_slotted(Trail)(15000, 1, 75)
+        hills = homework.make_slotted(Hills)(15000, 1, 75)
+    assert trail.show_training_info().calories == 42.0, (
+        '`show_training_info` должен использовать переопределённый '
+        '`get_spent_calories`.'
+    )
+    assert hills.show_training_info().calories == 9.75 * 2, (
+        '`show_training_info` должен использовать переопределённый '
+        '`get_spent_calories_for`.'
+    )
+
+
+@pytest.mark.parametrize('slotted', [False, True])
+def test_plugin_mean_speed_override(monkeypatch, slotted):
+    monkeypatch.setattr(homework, 'WORKOUT_REGISTRY',
+                        dict(homework.WORKOUT_REGISTRY))
+
+    @dataclass
+    class Cycling(homework.Training):
+        def get_mean_speed(self) -> float:
+            return 30.0
+
+        def get_spent_calories(self) -> float:
+            return self.get_mean_speed() * self.weight
+
+    homework.register_workout('CYC', Cycling)
+    training = homework.read_package('CYC', [500, 1, 80], slotted=slotted)
+    info = training.show_training_info()
+    assert info.speed == 30.0, (
+        '`show_training_info` должен использовать переопределённый '
+        '`get_mean_speed`.'
+    )
+    assert info.calories == 30.0 * 80
+
+
+@pytest.mark.parametrize('slotted', [False, True])
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [9000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_compute_metrics(workout_type, data, slotted):
+    training = homework.read_package(workout_type, data, slotted=slotted)
+    assert training.compute_metrics() == (
+        training.duration,
+        training.get_distance(),
+        training.get_mean_speed(),
+        training.get_spent_calories(),
+    ), '`compute_metrics` должен совпадать с отдельными методами.'
+    if not slotted:
+        assert set(vars(training)) == set(training.__match_args__), (
+            'Тренировка не должна хранить рассчитанные показатели.'
+        )
+    training.duration = 2
+    assert training.compute_metrics()[2] == training.get_mean_speed(), (
+        'Показатели должны пересчитываться при изменении полей.'
+    )
+
+
+@pytest.mark.parametrize('message_format, expected', [
+    ('text', [
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 797.805.'
+    ] * 3),
+    ('csv', ['training_type,duration,distance,speed,calories']
+     + ['Running,1,9.75,9.75,797.805'] * 3),
+    ('ndjson', ['{"training_type": "Running", "duration": 1, '
+                '"distance": 9.75, "speed": 9.75, "calories": 797.805}'] * 3),
+])
+def test_write_messages(message_format, expected):
+    info = homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+    stream = StringIO()
+    written = homework.write_messages([info] * 3, stream, message_format,
+                                      chunk_size=2)
+    assert written == 3
+    assert stream.getvalue().splitlines() == expected
+
+
+def test_write_messages_default_stream():
+    info = homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+    with Capturing() as output:
+        homework.write_messages([info])
+    assert output == [info.get_message()], (
+        '`write_messages` должен писать в текущий `sys.stdout`.'
+    )
+
+
+def test_validate_packages():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 0, 75]),
+        ('WLK', [9000, 1, 75, 0]),
+        ('SWM', [720, 1, 80, -25, 40]),
+        ('RUN', [15000, None, 75]),
+        ('RUN', [15000, 1]),
+        ('XXX', [1]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ]
+    mask, errors = homework.validate_packages(packages)
+    assert mask == [True, False, False, False, False, False, False, True]
+    assert [error.index for error in errors] == [1, 2, 3, 4, 5, 6]
+    assert errors[0].data == [15000, 0, 75]
+    assert 'duration' in errors[0].reason
+    assert 'height' in errors[1].reason
+    assert 'length_pool' in errors[2].reason
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('RUN', [15000, float('nan'), 75]),
+    ('RUN', [15000, 1, float('inf')]),
+    ('RUN', [True, 1, 75]),
+    ('RUN', [15000, '1', 75]),
+    ('RUN', 5),
+    (['RUN'], [15000, 1, 75]),
+])
+def test_find_data_error_rejects(workout_type, data):
+    assert homework.find_data_error(workout_type, data), (
+        'Нечисловые, бесконечные и логические значения должны '
+        'отклоняться.'
+    )
+
+
+@pytest.mark.parametrize('training_class, args, expected', [
+    (homework.Running, (9.75, 75, 1), 797.805),
+    (homework.SportsWalking, (5.85, 75, 1, 180), 349.252),
+    (homework.Swimming, (1.0, 80, 1), 336.0),
+])
+def test_calories_kernel(training_class, args, expected):
+    assert callable(training_class.calories_kernel), (
+        f'У класса `{training_class.__name__}` должна быть функция '
+        'расчёта калорий `calories_kernel`.'
+    )
+    assert round(training_class.calories_kernel(*args), 3) == expected
+    assert homework.Training.calories_kernel is None
@@ -0,0 +1,48 @@
+import homework
+import instrumentation
+import parallel
+import result_cache
+import server
+
+
+def test_instrumentation():
+    original = homework.read_package
+    events = []
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        instrumentation.register_hook(
+            'start', lambda stage: events.append(('start', stage)))
+        assert instrumentation.is_enabled()
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info(
+        ).get_message()
+        homework.read_package('SWM', [720, 1, 80, 25, 40])
+    finally:
+        instrumentation.HOOKS['start'].clear()
+        instrumentation.disable()
+    assert homework.read_package is original
+    assert not instrumentation.is_enabled()
+    snapshot = instrumentation.snapshot()
+    assert {stage: stats['count'] for stage, stats in snapshot.items()} == {
+        'check_correct_data': 2,
+        'read_package': 2,
+        'get_spent_calories': 1,
+        'get_message': 1,
+    }
+    assert sum(snapshot['read_package']['histogram'].values()) == 2
+    assert events[:2] == [('start', 'read_package'),
+                          ('start', 'check_correct_data')]
+
+
+def test_instrumentation_sees_project_modules():
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        result_cache.PackageCache().get_info('RUN', [15000, 1, 75])
+        server.handle_line('WLK 9000 1 75 180')
+        parallel.process_chunk(0, [('SWM', [720, 1, 80, 25, 40])])
+    finally:
+        instrumentation.disable()
+    snapshot = instrumentation.snapshot()
+    assert snapshot['read_package']['count'] == 3
+    assert snapshot['get_spent_calories']['count'] == 3
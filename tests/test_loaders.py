@@ -0,0 +1,81 @@
+from io import StringIO
+
+import homework
+import loaders
+
+EXPECTED = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+]
+
+
+def test_iter_csv_packages():
+    header = StringIO(
+        'workout_type,action,duration,weight,height,length_pool,count_pool\n'
+        'SWM,720,1,80,,25,40\n'
+        'RUN,15000,1,75,,,\n'
+        'WLK,3000.33,2.512,75.8,180.1,,\n')
+    positional = StringIO(
+        'SWM,720,1,80,25,40\nRUN,15000,1,75\n\nWLK,3000.33,2.512,75.8,180.1\n')
+    assert list(loaders.iter_csv_packages(header)) == EXPECTED
+    assert list(loaders.iter_csv_packages(positional)) == EXPECTED
+
+
+def test_iter_ndjson_packages():
+    source = StringIO(
+        '{"workout_type": "SWM", "action": 720, "duration": 1, '
+        '"weight": 80, "length_pool": 25, "count_pool": 40}\n'
+        '["RUN", [15000, 1, 75]]\n'
+        '{"workout_type": "WLK", "action": 3000.33, "duration": 2.512, '
+        '"weight": 75.8, "height": 180.1}\n')
+    assert list(loaders.iter_ndjson_packages(source)) == EXPECTED
+
+
+def test_load_batches():
+    source = StringIO(
+        'RUN,15000,1,75\nRUN,15000,0,75\nWLK,9000,1,75\n'
+        'XXX,1,2\nWLK,9000,1,75,180\nRUN,1206,12,6\n')
+    chunks = list(loaders.load_batches(
+        loaders.iter_csv_packages(source), chunk_size=4))
+    assert len(chunks) == 2
+    errors = [error.index for _, chunk_errors in chunks
+              for error in chunk_errors]
+    assert errors == [1, 2, 3]
+    messages = [info for batches, _ in chunks
+                for training_batch in batches.values()
+                for info in training_batch.messages()]
+    assert messages == [
+        homework.read_package(*package).show_training_info()
+        for package in [('RUN', [15000, 1, 75]), ('WLK', [9000, 1, 75, 180]),
+                        ('RUN', [1206, 12, 6])]
+    ]
+
+
+def test_load_batches_malformed_rows():
+    csv_source = StringIO(
+        'workout_type,action,duration,weight,height,length_pool,count_pool\n'
+        'RUN,15000,1,75,,,\n'
+        'RUN,fast,1,75,,,\n'
+        'RUN,15000\n'
+        'WLK,9000,1,75,180,,\n')
+    ndjson_source = StringIO(
+        '["RUN", [15000, 1, 75]]\n'
+        '{"workout_type": "RUN", broken\n'
+        '["RUN", 5]\n'
+        '7\n'
+        '{"workout_type": ["RUN"]}\n'
+        '["WLK", [9000, 1, 75, 180]]\n')
+    for packages, bad in [
+            (loaders.iter_csv_packages(csv_source), [1, 2]),
+            (loaders.iter_ndjson_packages(ndjson_source), [1, 2, 3, 4])]:
+        chunks = list(loaders.load_batches(packages, chunk_size=2))
+        errors = [error for _, chunk_errors in chunks
+                  for error in chunk_errors]
+        assert [error.index for error in errors] == bad, (
+            'Некорректные строки должны становиться ошибками с номером '
+            'пакета в файле.'
+        )
+        assert all(error.reason for error in errors)
+        assert sum(len(training_batch) for batches, _ in chunks
+                   for training_batch in batches.values()) == 2
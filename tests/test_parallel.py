@@ -0,0 +1,123 @@
+import gc
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+import homework
+import parallel
+
+
+def test_process_packages_parallel():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('RUN', [15000, 1]),
+        'WLK 9000 1 75 180',
+        '',
+        ('WLK', [9000, 0, 75, 180]),
+        ('XXX', [1, 2, 3]),
+    ] * 5
+    messages, errors = parallel.process_packages_parallel(
+        packages, workers=2, chunk_size=4)
+    expected = [
+        homework.read_package(*package).show_training_info()
+        for package in packages[:2] + [('WLK', [9000, 1, 75, 180])]
+    ] * 5
+    assert messages == expected, (
+        'Результаты должны сохранять порядок входных пакетов.'
+    )
+    assert [error.index for error in errors] == [
+        index + 7 * repeat for repeat in range(5) for index in (2, 5, 6)
+    ]
+    assert errors[0].workout_type == 'RUN'
+    assert 'duration' in errors[1].reason
+
+
+def test_process_packages_parallel_bad_values():
+    packages = [
+        ('RUN', [15000, None, 75]),
+        ('RUN', [15000, '1', 75]),
+        'RUN 15000 x 75',
+        ('RUN', 5),
+        'RUN',
+        ('RUN', [15000, 1, 75]),
+    ]
+    messages, errors = parallel.process_packages_parallel(
+        packages, workers=2, chunk_size=2)
+    assert messages == [
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info()]
+    assert [error.index for error in errors] == [0, 1, 2, 3, 4]
+    assert all(error.workout_type == 'RUN' for error in errors)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 100])
+def test_iter_chunks(chunk_size):
+    source = [('RUN', [i, 1, 75]) for i in range(10)]
+    chunks = list(parallel.iter_chunks(source, chunk_size))
+    assert [package for _, chunk in chunks for package in chunk] == source
+    assert [start for start, _ in chunks] == list(range(0, 10, chunk_size))
+
+
+def test_process_packages_shared():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        'RUN 15000 1 75',
+        ('RUN', [15000, 1]),
+        ('WLK', [9000, 0, 75, 180]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ] * 4
+    with parallel.process_packages_shared(
+            packages, workers=2, chunk_size=3) as results:
+        assert len(results) == 20
+        assert isinstance(results.columns['calories'], memoryview)
+        expected = [
+            homework.read_package(*package).show_training_info()
+            for package in [packages[0], ('RUN', [15000, 1, 75]),
+                            packages[4]]
+        ] * 4
+        assert list(results.messages()) == expected
+        assert [error.index for error in results.errors] == [
+            index + 5 * repeat for repeat in range(4) for index in (2, 3)]
+        assert not results.is_valid(2)
+        with pytest.raises(NameError):
+            results.message(2)
+
+
+def test_process_packages_shared_positions():
+    packages = ['', ('RUN', [1, 2]), 'RUN 15000 x 75',
+                ('RUN', [15000, None, 75]), 'RUN 15000 1 75']
+    with parallel.process_packages_shared(
+            packages, workers=2, chunk_size=2) as results:
+        shared_errors = [error.index for error in results.errors]
+        assert [results.is_valid(index) for index in range(5)] == [
+            False, False, False, False, True]
+    _, errors = parallel.process_packages_parallel(
+        packages, workers=2, chunk_size=2)
+    assert shared_errors == [error.index for error in errors] == [1, 2, 3]
+
+
+def test_process_packages_shared_generator():
+    packages = [('SWM', [720, 1, 80, 25, 40]), 'RUN 15000 1 75',
+                ('WLK', [9000, 1, 75, 180])] * 3
+    with parallel.process_packages_shared(
+            iter(packages), workers=2, chunk_size=2) as results:
+        assert not hasattr(results, 'packages'), (
+            'Результаты не должны хранить исходные пакеты.'
+        )
+        assert [results.codes[code] for code in results.columns['code']] == [
+            parallel.package_type(package) for package in packages]
+        assert list(results.messages()) == [
+            homework.read_package(*homework.parse_package(package))
+            .show_training_info() if isinstance(package, str)
+            else homework.read_package(*package).show_training_info()
+            for package in packages]
+
+
+def test_shared_results_finalizer():
+    results = parallel.process_packages_shared(
+        [('RUN', [15000, 1, 75])], workers=1)
+    name = results._finalizer.peek()[2][0].name
+    del results
+    gc.collect()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
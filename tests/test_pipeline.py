@@ -0,0 +1,35 @@
+from io import StringIO
+
+import pytest
+
+import homework
+import pipeline
+
+
+@pytest.mark.parametrize('queue_size, flush_size', [(1, 1), (4, 3), (64, 256)])
+def test_run_pipeline(queue_size, flush_size):
+    packages = ['SWM 720 1 80 25 40', ('RUN', [15000, 1, 75])] * 10
+    stream = StringIO()
+    stats = pipeline.run_pipeline(packages, stream, 'csv',
+                                  queue_size=queue_size,
+                                  flush_size=flush_size)
+    expected = StringIO()
+    homework.write_messages(homework.stream_packages(packages), expected,
+                            'csv')
+    assert stream.getvalue() == expected.getvalue()
+    assert stats.messages == 20
+    assert stats.batches == -(-20 // flush_size)
+    assert stats.throughput > 0
+    assert stats.max_latency >= stats.mean_latency >= 0
+
+
+def test_run_pipeline_errors():
+    class BrokenStream(StringIO):
+        def write(self, text):
+            raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        pipeline.run_pipeline(['RUN 15000 1 75'] * 5, BrokenStream(),
+                              flush_size=1)
+    with pytest.raises(NameError):
+        pipeline.run_pipeline(['RUN 1 2'], StringIO())
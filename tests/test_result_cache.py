@@ -0,0 +1,47 @@
+import pytest
+
+import homework
+import result_cache
+
+
+def test_package_cache_hits():
+    cache = result_cache.PackageCache(maxsize=2)
+    first = cache.get_info('RUN', [15000, 1, 75])
+    assert cache.get_info('RUN', [15000, 1, 75]) == first
+    assert first == homework.read_package(
+        'RUN', [15000, 1, 75]).show_training_info()
+    cache.get_info('SWM', [720, 1, 80, 25, 40])
+    cache.get_info('WLK', [9000, 1, 75, 180])
+    assert len(cache) == 2
+    cache.get_info('RUN', [15000, 1, 75])
+    assert cache.stats() == {'hits': 1, 'misses': 4, 'size': 2,
+                             'maxsize': 2}
+
+
+def test_package_cache_ttl():
+    now = [0.0]
+    cache = result_cache.PackageCache(ttl=10, clock=lambda: now[0])
+    cache.get_info('RUN', [15000, 1, 75])
+    now[0] = 9.5
+    cache.get_info('RUN', [15000, 1, 75])
+    now[0] = 20
+    cache.get_info('RUN', [15000, 1, 75])
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_package_cache_errors():
+    cache = result_cache.PackageCache()
+    with pytest.raises(NameError):
+        cache.get_info('RUN', [15000, 1])
+    assert len(cache) == 0
+
+
+def test_package_cache_returns_copies():
+    cache = result_cache.PackageCache()
+    first = cache.get_info('RUN', [15000, 1, 75])
+    first.calories = 0
+    second = cache.get_info('RUN', [15000, 1, 75])
+    assert second is not first
+    assert second.calories == pytest.approx(797.805), (
+        'Изменение полученного сообщения не должно менять кеш.'
+    )
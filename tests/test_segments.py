@@ -0,0 +1,42 @@
+import pytest
+
+import homework
+import segments
+
+
+def test_compute_segments_running():
+    steps = [3] * 3600
+    result = segments.compute_segments(
+        'RUN', {'action': steps}, {'weight': 75}, samples_per_segment=600)
+    assert len(result['segments']['distance']) == 6
+    assert result['segments']['duration'] == [600 / 3600] * 6
+    whole = homework.Running(10800, 1, 75).show_training_info()
+    assert result['cumulative']['distance'][-1] == pytest.approx(
+        whole.distance)
+    assert result['cumulative']['calories'][-1] == pytest.approx(
+        whole.calories)
+    assert sum(result['segments']['distance']) == pytest.approx(
+        whole.distance)
+
+
+def test_compute_segments_swimming():
+    laps = [0, 0, 1, 0] * 30
+    strokes = [10] * 120
+    result = segments.compute_segments(
+        'SWM', {'action': strokes, 'count_pool': laps},
+        {'weight': 80, 'length_pool': 25}, interval=30,
+        samples_per_segment=50)
+    assert result['segments']['duration'] == pytest.approx(
+        [50 * 30 / 3600] * 2 + [20 * 30 / 3600])
+    whole = homework.Swimming(1200, 1, 80, 25, 30).show_training_info()
+    assert result['cumulative']['speed'][-1] == pytest.approx(whole.speed)
+    assert result['cumulative']['calories'][-1] == pytest.approx(
+        whole.calories)
+
+
+def test_compute_segments_errors():
+    with pytest.raises(ValueError):
+        segments.compute_segments('WLK', {'action': [1]}, {'weight': 75})
+    with pytest.raises(ValueError):
+        segments.compute_segments('SWM', {'action': [1], 'count_pool': []},
+                                  {'weight': 75, 'length_pool': 25})
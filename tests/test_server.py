@@ -0,0 +1,148 @@
+import asyncio
+import io
+import json
+import socket
+
+import pytest
+
+import client
+import server
+
+
+async def exchange(lines, **kwargs):
+    app = await server.start_server(port=0, **kwargs)
+    port = app.sockets[0].getsockname()[1]
+    async with app:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(''.join(f'{line}\n' for line in lines).encode())
+        writer.write_eof()
+        responses = [line.decode().rstrip('\n') async for line in reader]
+        writer.close()
+        await writer.wait_closed()
+    return responses
+
+
+def test_server_text():
+    responses = asyncio.run(exchange(
+        ['SWM 720 1 80 25 40', '["RUN", [1206, 12, 6]]', 'RUN 1 2']))
+    assert responses == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: Running; '
+        'Длительность: 12.000 ч.; '
+        'Дистанция: 0.784 км; '
+        'Ср. скорость: 0.065 км/ч; '
+        'Потрачено ккал: 12.812.',
+        'Ошибка: Ожидалось полей: 3, получено: 2',
+    ]
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('WLK 9000 1 75 180', {'training_type': 'SportsWalking',
+                           'duration': 1, 'distance': 5.85,
+                           'speed': 5.85}),
+    ('WLK 9000 0 75 180',
+     {'error': 'Недопустимое значение поля duration: 0'}),
+])
+def test_server_json(line, expected):
+    responses = asyncio.run(exchange([line], response_format='json'))
+    result = json.loads(responses[0])
+    assert expected.items() <= result.items()
+
+
+@pytest.mark.parametrize('line', [
+    'RUN 15000 nan 75',
+    'RUN 15000 -1 75',
+    '["RUN", [15000, true, 75]]',
+    '["RUN", [15000, "1", 75]]',
+    '[' * 5000,
+    'WLK 1e203 1 75 180',
+])
+def test_server_rejects_bad_values(line):
+    response = json.loads(server.handle_line(line, 'json'))
+    assert list(response) == ['error'], (
+        'Сервер должен проверять пакет так же, как командная строка.'
+    )
+
+
+def test_daemon_client(tmp_path):
+    path = str(tmp_path / 'homework.sock')
+    source = io.BytesIO(b'RUN 15000 1 75\n' * 1000)
+    target = io.BytesIO()
+
+    async def run():
+        app = await server.start_server(path=path)
+        async with app:
+            await asyncio.to_thread(client.forward, path, source, target)
+
+    asyncio.run(run())
+    lines = target.getvalue().decode().splitlines()
+    assert len(lines) == 1000
+    assert lines[0] == (
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 797.805.'
+    )
+
+
+def test_remove_stale_socket(tmp_path):
+    path = tmp_path / 'homework.sock'
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    server.remove_stale_socket(str(path))
+    assert not path.exists(), 'Брошенный сокет должен удаляться.'
+
+    listening = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listening.bind(str(path))
+    listening.listen()
+    try:
+        with pytest.raises(OSError):
+            server.remove_stale_socket(str(path))
+        assert path.exists(), 'Рабочий сокет удалять нельзя.'
+    finally:
+        listening.close()
+
+    regular = tmp_path / 'data.txt'
+    regular.write_text('важные данные', encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        asyncio.run(server.start_server(path=str(regular)))
+    assert regular.read_text(encoding='utf-8') == 'важные данные'
+
+
+def test_server_refuses_extra_clients():
+    async def run():
+        app = await server.start_server(port=0, max_clients=1)
+        port = app.sockets[0].getsockname()[1]
+        async with app:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'RUN 15000 1 75\n')
+            first = await reader.readline()
+            extra_reader, extra_writer = await asyncio.open_connection(
+                '127.0.0.1', port)
+            refused = [line async for line in extra_reader]
+            extra_writer.close()
+            writer.write_eof()
+            rest = [line async for line in reader]
+            writer.close()
+            await writer.wait_closed()
+        return first, refused, rest
+
+    first, refused, rest = asyncio.run(run())
+    assert first.startswith('Тип тренировки: Running'.encode())
+    assert refused == [f'Ошибка: {server.BUSY_MESSAGE}\n'.encode()], (
+        'Клиент сверх лимита должен получить ответ и закрытое соединение.'
+    )
+    assert rest == []
+
+
+def test_server_line_too_long():
+    responses = asyncio.run(exchange(['RUN ' + '1' * 70000, 'RUN 15000 1 75'],
+                                     response_format='json'))
+    assert responses == [json.dumps({'error': server.TOO_LONG_MESSAGE},
+                                    ensure_ascii=False)]
@@ -0,0 +1,48 @@
+import pickle
+import random
+
+import pytest
+
+import homework
+import sketches
+
+
+def test_log_histogram_accuracy():
+    random.seed(0)
+    values = [random.lognormvariate(2, 1) for _ in range(20000)]
+    histogram = sketches.LogHistogram(relative_accuracy=0.01)
+    for value in values:
+        histogram.add(value)
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert len(histogram.buckets) < 2048
+
+
+def test_log_histogram_bounded():
+    histogram = sketches.LogHistogram(max_buckets=16)
+    for value in range(1, 10000):
+        histogram.add(value)
+    histogram.add(0)
+    assert len(histogram.buckets) == 16
+    assert histogram.count == 10000
+    assert histogram.quantile(0) == 0
+    assert histogram.quantile(1) == pytest.approx(9999, rel=0.011)
+
+
+def test_metric_sketches_merge():
+    packages = [('RUN', [random.randint(1000, 20000), 1, 75])
+                for _ in range(1000)]
+    messages = [homework.read_package(*package).show_training_info()
+                for package in packages]
+    whole = sketches.MetricSketches()
+    whole.extend(messages)
+    first, second = sketches.MetricSketches(), sketches.MetricSketches()
+    first.extend(messages[:300])
+    second.extend(messages[300:])
+    first.merge(pickle.loads(pickle.dumps(second)))
+    assert first.quantiles('Running', 'calories') == whole.quantiles(
+        'Running', 'calories')
+    with pytest.raises(ValueError):
+        sketches.LogHistogram(0.01).merge(sketches.LogHistogram(0.02))
@@ -0,0 +1,44 @@
+import pytest
+
+import homework
+import store
+
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def result_store(tmp_path):
+    with store.ResultStore(str(tmp_path / 'results.db')) as result_store:
+        yield result_store
+
+
+def test_result_store(result_store):
+    packages = [
+        ('anna', 0, ('SWM', [720, 1, 80, 25, 40])),
+        ('anna', 10 * DAY, ('SWM', [420, 4, 20, 42, 4])),
+        ('ivan', 20 * DAY, ('SWM', [1206, 12, 6, 12, 6])),
+        ('anna', 40 * DAY, ('SWM', [720, 1, 80, 25, 40])),
+        ('anna', 15 * DAY, ('RUN', [15000, 1, 75])),
+    ]
+    records = [(athlete, timestamp,
+                homework.read_package(*package).show_training_info())
+               for athlete, timestamp, package in packages]
+    assert result_store.add_many(records) == 5
+    month = result_store.aggregate('calories', training_type='Swimming',
+                                   start=0, end=30 * DAY)
+    assert month == pytest.approx(336.0 + 182.72 + 159.264)
+    assert result_store.aggregate('calories', 'SUM', 'Swimming', 'anna',
+                                  0, 30 * DAY) == pytest.approx(518.72)
+    assert result_store.aggregate('distance', 'COUNT') == 5
+    assert result_store.aggregate('speed', training_type='Walking') == 0
+    assert result_store.query(athlete='anna', start=10 * DAY) == [
+        records[1], records[4], records[3]]
+
+
+def test_result_store_indexes(result_store):
+    plan = ' '.join(str(row) for row in result_store.connection.execute(
+        'EXPLAIN QUERY PLAN SELECT SUM(calories) FROM results '
+        "WHERE training_type = 'Swimming' AND timestamp >= 0"))
+    assert 'results_type_time' in plan
+    with pytest.raises(ValueError):
+        result_store.aggregate('calories; DROP TABLE results')